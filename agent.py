@@ -9,14 +9,31 @@ All actions, votes, and discussion statements are logged for evaluation.
 
 import random
 import re
+import sys
 import logging
 from typing import List, Dict, Optional
 
-from constants import AgentType, KILL_PREFIX, SEARCH_PREFIX, GO_TO_PREFIX
+import numpy as np
+
+from constants import AgentType, KILL_PREFIX, SEARCH_PREFIX, GO_TO_PREFIX, parse_action
 from gpt_agent import GptAgentMixin
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for the hot parse paths; compiling once at module
+# scope avoids the per-call lookup in re's internal pattern cache.
+_VOTE_LINE_RE = re.compile(r"(\d+)\.\s*(.*)")
+
+# Integer ids for the agent types, used to index the per-player dispatch
+# tables so the per-turn hot path does one int compare / tuple lookup
+# instead of a chain of string comparisons.
+_AGENT_ID_MAP = {
+    AgentType.RANDOM.value: 0,
+    AgentType.CLI.value: 1,
+    AgentType.GPT.value: 2,
+}
+AGENT_RANDOM, AGENT_CLI, AGENT_GPT = 0, 1, 2
+
 class Player(GptAgentMixin):
     """
     Represents a single player in the game.
@@ -35,18 +52,38 @@ class Player(GptAgentMixin):
         actions (List[str]): History of actions taken during the game.
         votes (List[str]): History of votes cast during the game.
         witness (bool): Flag indicating if the player witnessed a kill.
-        witness_during_vote (List[bool]): Records of whether the player witnessed a kill during each vote.
+        witness_during_vote (bytearray): Per-vote record (1/0) of whether the player witnessed a kill.
         awaiting_response (bool): Indicates if the player is waiting for an input.
         invalid_votes_for_eliminated (int): Count of votes cast for players already eliminated.
-        eliminated_player_names (List[str]): Names of players who have been removed.
+        eliminated_player_names (frozenset): Names of players who have been removed.
         location (str): The current room/location of the player.
         eval (Dict): Dictionary used to accumulate evaluation metrics for post-game analysis.
     """
     VALID_LOCATIONS = ["Bedroom", "Bathroom", "Kitchen", "Hallway"]
 
+    # Fixed attribute layout: drops the per-instance __dict__, which lowers
+    # memory per Player and makes attribute access a direct slot lookup —
+    # relevant when sweeps instantiate thousands of players.
+    __slots__ = (
+        "name", "killer", "preprompt", "alive", "banished", "has_key",
+        "agent", "model", "gpt", "_story_parts", "_story_cache", "actions",
+        "parsed_actions", "votes", "witness",
+        "witness_during_vote", "_witness_count", "_self_vote_count",
+        "awaiting_response",
+        "invalid_votes_for_eliminated", "eliminated_player_names",
+        "location", "eval", "_rng", "_agent_id", "_agent_enum",
+        "_choice_dispatch",
+        "_statement_dispatch",
+    )
+
     def __init__(self, name: str, killer: bool, preprompt: str, agent: str, start_location: str = "random"):
-        # Basic initialization of the player's attributes.
-        self.name = name
+        # Basic initialization of the player's attributes. Interning the name
+        # makes the many name-equality checks in the vote tallies pointer
+        # comparisons rather than character scans.
+        self.name = sys.intern(name)
+        # Per-player RNG: sidesteps the module-level instance shared across
+        # threads and keeps a player's draws independent and seedable.
+        self._rng = random.Random()
         self.killer = killer
         self.preprompt = preprompt
         self.alive = True
@@ -59,16 +96,28 @@ class Player(GptAgentMixin):
         self.model: Optional[str] = None
         self.gpt = None
 
-        # Initialize logs and game state tracking.
-        self.story = ""
+        # Initialize logs and game state tracking. The story is kept as a
+        # list of segments and joined on demand: repeated string += would be
+        # O(n) per append and quadratic over a long game.
+        self._story_parts: List[str] = []
+        self._story_cache: Optional[str] = None
         self.actions: List[str] = []
+        # Structured (verb, target) mirror of actions, parsed once at
+        # record time so update_state dispatches on the verb enum.
+        self.parsed_actions: List = []
         self.votes: List[str] = []
         self.witness = False
-        self.witness_during_vote: List[bool] = []
+        # One byte per vote instead of a list of bool objects; converts
+        # cheaply to a NumPy mask in finalize_eval.
+        self.witness_during_vote = bytearray()
+        # Running tallies of witness and self votes; keep finalize_eval O(1)
+        # for these statistics.
+        self._witness_count = 0
+        self._self_vote_count = 0
         self.awaiting_response = False
 
         self.invalid_votes_for_eliminated = 0
-        self.eliminated_player_names: List[str] = []
+        self.eliminated_player_names: frozenset = frozenset()
 
         # Set the player's starting location (either provided or chosen randomly).
         self.location = self._resolve_start_location(start_location)
@@ -78,14 +127,82 @@ class Player(GptAgentMixin):
 
         # Initialize an evaluation dictionary to accumulate game metrics.
         self.eval = self._init_eval_dict()
-        self.eval.setdefault("discussion_participation", 0)
-        self.eval.setdefault("banished_in_discussion", 0)
 
         logger.info("Initialized Player '%s'. Killer=%s, Agent='%s', Location='%s'",
                     self.name, self.killer,
                     f"{self.agent}{('-' + self.model) if self.model else ''}",
                     self.location)
 
+    @classmethod
+    def create(cls, name: str, killer: bool, preprompt: str, agent: str,
+               start_location: str = "random") -> "Player":
+        """
+        Factory that returns the Player subclass matching the agent string.
+
+        The subclasses override the per-turn fetch methods directly, so games
+        built through the factory dispatch polymorphically instead of going
+        through the bound-handler indirection.
+
+        Args:
+            name (str): The player's name.
+            killer (bool): True if the player is the killer.
+            preprompt (str): Key of the introduction prompt to use.
+            agent (str): Agent string such as "cli", "random", or "gpt-<model>".
+            start_location (str): Starting room, or "random".
+
+        Returns:
+            Player: An instance of RandomPlayer, CliPlayer, or GptPlayer.
+        """
+        if agent.startswith("gpt"):
+            agent_id = AGENT_GPT
+        else:
+            agent_id = _AGENT_ID_MAP.get(agent)
+            if agent_id is None:
+                raise ValueError(f"Unrecognized agent type: {agent}")
+        subclass = _PLAYER_SUBCLASSES[agent_id]
+        return subclass(name, killer, preprompt, agent, start_location)
+
+    @property
+    def story(self) -> str:
+        """
+        The player's full narrative log, joined from the stored segments.
+
+        The join is cached until the next append, since the story is read
+        several times per turn (CLI printing, GPT prompts) between writes.
+        """
+        if self._story_cache is None:
+            self._story_cache = "".join(self._story_parts)
+        return self._story_cache
+
+    @story.setter
+    def story(self, value: str) -> None:
+        self._story_parts = [value] if value else []
+        self._story_cache = value or ""
+
+    def append_story(self, text: str) -> None:
+        """
+        Appends a segment to the player's narrative log in O(1).
+
+        Args:
+            text (str): The text segment to append.
+        """
+        if text:
+            self._story_parts.append(text)
+            self._story_cache = None
+
+    def reset_votes(self) -> None:
+        """
+        Discards the player's ballots ahead of a tie revote.
+
+        The list is cleared in place — rebinding it would detach the alias
+        eval['votes'] holds — and the running self-vote counter is rewound
+        with it, so votes from the thrown-away round do not inflate
+        vote_rate_for_self. The witness record deliberately keeps its
+        entries, matching the original tie semantics.
+        """
+        self.votes.clear()
+        self._self_vote_count = 0
+
     def set_eliminated_players(self, eliminated_list: List[str]) -> None:
         """
         Updates the player's record of which players have been eliminated.
@@ -93,7 +210,8 @@ class Player(GptAgentMixin):
         Args:
             eliminated_list (List[str]): List of names of eliminated players.
         """
-        self.eliminated_player_names = eliminated_list[:]
+        # A frozenset makes the per-vote membership checks O(1).
+        self.eliminated_player_names = frozenset(eliminated_list)
 
     def _resolve_start_location(self, requested_location: str) -> str:
         """
@@ -106,7 +224,7 @@ class Player(GptAgentMixin):
             str: A valid room from VALID_LOCATIONS.
         """
         if requested_location == "random":
-            return random.choice(self.VALID_LOCATIONS)
+            return self._rng.choice(self.VALID_LOCATIONS)
         if requested_location not in self.VALID_LOCATIONS:
             raise ValueError(f"Invalid start location: {requested_location}")
         return requested_location
@@ -127,6 +245,20 @@ class Player(GptAgentMixin):
         valid_types = {a.value for a in AgentType}
         if self.agent not in valid_types:
             raise ValueError(f"Unrecognized agent type: {self.agent}")
+        # Interned so agent-type equality checks are pointer comparisons;
+        # the enum member supports even cheaper identity comparisons.
+        self.agent = sys.intern(self.agent)
+        self._agent_enum = AgentType(self.agent)
+
+        # Bind the per-agent handlers once so the per-turn dispatch is a
+        # single tuple index rather than an if/elif chain of string compares.
+        self._agent_id = _AGENT_ID_MAP[self.agent]
+        self._choice_dispatch = (
+            self._random_choice, self._cli_choice, self._gpt_choice
+        )[self._agent_id]
+        self._statement_dispatch = (
+            self._default_statement, self._cli_statement, self._get_gpt_statement
+        )[self._agent_id]
 
     def _init_eval_dict(self) -> Dict[str, any]:
         """
@@ -146,6 +278,9 @@ class Player(GptAgentMixin):
             "actions": self.actions,
             "votes": self.votes,
             "vote_rate_for_killer": None,  # Placeholder for later calculation.
+            "vote_rate_for_self": None,
+            "discussion_participation": 0,
+            "banished_in_discussion": 0,
         }
         if not self.killer:
             eval_dict.update({
@@ -196,47 +331,189 @@ class Player(GptAgentMixin):
             except ValueError:
                 print("Invalid input. Please enter a number.")
             attempts += 1
-        fallback_choice = random.choice(valid)
+        fallback_choice = self._rng.choice(valid)
         print(f"No valid input received after {max_attempts} attempts. Defaulting to {fallback_choice}.")
         return fallback_choice
 
+    # ----------------------------- Agent Dispatch Handlers -----------------------------
+    def _random_choice(self, valid: List[int], prompt: str) -> Optional[int]:
+        """
+        Picks a random option; handler for the RANDOM agent type.
+        """
+        return self._rng.choice(valid) if valid else None
+
+    def _cli_choice(self, valid: List[int], prompt: str) -> Optional[int]:
+        """
+        Prompts the user for an option; handler for the CLI agent type.
+        """
+        return self._get_cli_choice(prompt, valid)
+
+    def _gpt_choice(self, valid: List[int], prompt: str) -> Optional[int]:
+        """
+        Queries GPT for an option; handler for the GPT agent type.
+        """
+        return self.get_gpt_action(prompt)
+
+    def _default_statement(self, discussion_log: str) -> str:
+        """
+        Returns the stock statement; handler for the RANDOM agent type.
+        """
+        return "I don't know what to say."
+
+    def _cli_statement(self, discussion_log: str) -> str:
+        """
+        Reads a statement from the user; handler for the CLI agent type.
+        """
+        print(self.story)
+        print(discussion_log)
+        return input()
+
     # ----------------------------- Action Phase Methods -----------------------------
-    def get_action(self, action_prompt: str) -> str:
+    def get_action(self, action_prompt: str, options: Optional[Dict[int, str]] = None) -> str:
         """
         Obtains an action from the player during the Action Phase.
         Handles retries and falls back to a random valid action if needed.
-        
+
         Args:
             action_prompt (str): The prompt listing possible actions.
-        
+            options (Dict[int, str], optional): Mapping of option numbers to
+                action texts, as constructed by the game engine. When given,
+                parsing and decoding skip the prompt-string scans entirely.
+
         Returns:
             str: The text of the selected action.
         """
         self.awaiting_response = True
-        logger.info("Action prompt for %s:\n%s", self.name, action_prompt)
-        valid_actions = self._parse_valid_actions(action_prompt)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Action prompt for %s:\n%s", self.name, action_prompt)
+        # Parse the prompt into the option map once; valid numbers and the
+        # chosen action's text both come from the same single scan.
+        if not options:
+            options = self._parse_action_options(action_prompt)
+        valid_actions = list(options.keys())
         if not valid_actions:
             logger.warning("No valid actions found for %s. Defaulting to 'No Action'.", self.name)
-            self.actions.append("No Action")
-            self.eval["num_turns"] += 1
+            self._record_action("No Action")
             self.awaiting_response = False
             return "No Action"
 
-        chosen_int = None
-        attempts = 0
-        max_attempts = 5
-        while chosen_int is None and attempts < max_attempts:
+        # Only the GPT path can return None and benefit from retries; the
+        # random and CLI handlers are deterministic in that regard, so a
+        # single call suffices for them.
+        if self._agent_id == AGENT_GPT:
+            chosen_int = None
+            attempts = 0
+            max_attempts = 5
+            while chosen_int is None and attempts < max_attempts:
+                chosen_int = self._fetch_action_int(valid_actions, action_prompt)
+                attempts += 1
+        else:
             chosen_int = self._fetch_action_int(valid_actions, action_prompt)
-            attempts += 1
         if chosen_int is None:
-            chosen_int = random.choice(valid_actions)
+            chosen_int = self._rng.choice(valid_actions)
             logger.warning("%s exceeded maximum attempts. Using fallback action: %s", self.name, chosen_int)
-        action_text = self._decode_action(action_prompt, chosen_int)
-        self.actions.append(action_text)
-        self.eval["num_turns"] += 1
+        action_text = options.get(chosen_int, "UNKNOWN_ACTION")
+        self._record_action(action_text)
         self.awaiting_response = False
         return action_text
 
+    def _record_action(self, action_text: str) -> None:
+        """
+        Appends an action to the history, in both string and parsed form.
+
+        Args:
+            action_text (str): The action string that was chosen.
+        """
+        self.actions.append(action_text)
+        self.parsed_actions.append(parse_action(action_text))
+        self.eval["num_turns"] += 1
+
+    def prepare_action(self, action_prompt: str, options: Optional[Dict[int, str]] = None) -> bool:
+        """
+        Enqueues the player's action request for batched GPT execution.
+
+        GPT-based players submit their prompt to the shared queue and return
+        immediately; the game loop flushes the queue once all players have
+        enqueued, and store_api_action is invoked with each result. Players
+        with other agent types fall back to the synchronous get_action path.
+
+        Args:
+            action_prompt (str): The prompt listing possible actions.
+            options (Dict[int, str], optional): Mapping of option numbers to
+                action texts, as constructed by the game engine.
+
+        Returns:
+            bool: True if the request was deferred to the batch queue;
+                  False if it was handled synchronously.
+        """
+        if self._agent_enum is not AgentType.GPT:
+            self.get_action(action_prompt, options)
+            return False
+        self.awaiting_response = True
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Action prompt for %s:\n%s", self.name, action_prompt)
+        valid_actions = list(options.keys()) if options else self._parse_valid_actions(action_prompt)
+        if not valid_actions:
+            logger.warning("No valid actions found for %s. Defaulting to 'No Action'.", self.name)
+            self._record_action("No Action")
+            self.awaiting_response = False
+            return False
+        option_dict = options or self._extract_list_items(action_prompt)
+        submitted = self.submit_prompt(
+            action_prompt, option_dict,
+            lambda probs: self._complete_action(action_prompt, valid_actions, probs, options)
+        )
+        if not submitted:
+            self.get_action(action_prompt, options)
+            return False
+        return True
+
+    def _complete_action(self, action_prompt: str, valid_actions: List[int], option_probs,
+                         options: Optional[Dict[int, str]] = None) -> None:
+        """
+        Finalizes a batched action request once the GPT result is available.
+
+        Args:
+            action_prompt (str): The prompt that was presented.
+            valid_actions (List[int]): List of valid numeric options.
+            option_probs: Probability dict returned by the GPT call.
+            options (Dict[int, str], optional): Mapping of option numbers to
+                action texts, used to decode without re-parsing the prompt.
+        """
+        chosen_int = self._choose_option(option_probs) if option_probs else None
+        if chosen_int is None or chosen_int not in valid_actions:
+            chosen_int = self._rng.choice(valid_actions)
+            logger.warning("%s received an invalid batched action. Using fallback action: %s",
+                           self.name, chosen_int)
+        self.store_api_action(action_prompt, chosen_int, options)
+
+    def _parse_action_options(self, prompt: str) -> Dict[int, str]:
+        """
+        Parses the numbered options from an action prompt in a single pass.
+
+        Args:
+            prompt (str): The full action prompt.
+
+        Returns:
+            Dict[int, str]: Mapping of option numbers to action texts.
+        """
+        # rfind + slice keeps only the tail; split() would also copy the
+        # (long) story prefix into a throwaway list.
+        marker = "Possible Actions:"
+        idx = prompt.rfind(marker)
+        if idx < 0:
+            return {}
+        substring = prompt[idx + len(marker):]
+        # Plain splitlines + isdigit beats a regex scan for these short
+        # prompts, and anchoring on "N." list heads avoids picking up
+        # numbers embedded in the action texts themselves.
+        options = {}
+        for line in substring.splitlines():
+            head, sep, rest = line.lstrip().partition('.')
+            if sep and head.isdigit():
+                options[int(head)] = rest.strip()
+        return options
+
     def _parse_valid_actions(self, prompt: str) -> List[int]:
         """
         Extracts valid action numbers from the prompt text.
@@ -247,10 +524,7 @@ class Player(GptAgentMixin):
         Returns:
             List[int]: A list of numeric options.
         """
-        if "Possible Actions:" not in prompt:
-            return []
-        substring = prompt.split("Possible Actions:")[-1]
-        return [int(n) for n in re.findall(r"\d+", substring)]
+        return list(self._parse_action_options(prompt).keys())
 
     def _fetch_action_int(self, valid_actions: List[int], action_prompt: str) -> Optional[int]:
         """
@@ -263,28 +537,24 @@ class Player(GptAgentMixin):
         Returns:
             int or None: The chosen action number.
         """
-        from constants import AgentType
-        if self.agent == AgentType.RANDOM.value:
-            return random.choice(valid_actions) if valid_actions else None
-        elif self.agent == AgentType.CLI.value:
-            return self._get_cli_choice(action_prompt, valid_actions)
-        elif self.agent == AgentType.GPT.value:
-            return self.get_gpt_action(action_prompt)
-        else:
-            logger.warning("Invalid or None action chosen by %s. Using None", self.name)
-            return None
+        return self._choice_dispatch(valid_actions, action_prompt)
 
-    def store_api_action(self, action_prompt: str, action_int: int) -> None:
+    def store_api_action(self, action_prompt: str, action_int: int,
+                         options: Optional[Dict[int, str]] = None) -> None:
         """
         Stores an action received via an external API call.
-        
+
         Args:
             action_prompt (str): The prompt text that was presented.
             action_int (int): The numeric option chosen.
+            options (Dict[int, str], optional): Mapping of option numbers to
+                action texts, used to decode without re-parsing the prompt.
         """
-        action_text = self._decode_action(action_prompt, action_int)
-        self.actions.append(action_text)
-        self.eval["num_turns"] += 1
+        if options:
+            action_text = options.get(action_int, "UNKNOWN_ACTION")
+        else:
+            action_text = self._decode_action(action_prompt, action_int)
+        self._record_action(action_text)
         self.awaiting_response = False
 
     def _decode_action(self, prompt: str, action_int: int) -> str:
@@ -298,16 +568,7 @@ class Player(GptAgentMixin):
         Returns:
             str: The action text.
         """
-        target = f"{action_int}. "
-        idx = prompt.find(target)
-        if idx < 0:
-            return "UNKNOWN_ACTION"
-        idx += len(target)
-        remainder = prompt[idx:]
-        newline_pos = remainder.find('\n')
-        if newline_pos < 0:
-            newline_pos = len(remainder)
-        return remainder[:newline_pos].strip()
+        return self._parse_action_options(prompt).get(action_int, "UNKNOWN_ACTION")
 
     # ----------------------------- Discussion Methods -----------------------------
     def get_statement(self, discussion_log: str) -> str:
@@ -320,50 +581,126 @@ class Player(GptAgentMixin):
         Returns:
             str: The player's discussion statement.
         """
-        logger.info("Discussion prompt for %s:\n%s", self.name, discussion_log)
-        from constants import AgentType
-        if self.agent == AgentType.RANDOM.value:
-            return "I don't know what to say."
-        elif self.agent == AgentType.CLI.value:
-            print(self.story)
-            print(discussion_log)
-            return input()
-        elif self.agent == AgentType.GPT.value:
-            return self._get_gpt_statement(discussion_log)
-        else:
-            return "I don't know what to say."
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Discussion prompt for %s:\n%s", self.name, discussion_log)
+        return self._statement_dispatch(discussion_log)
 
     # ----------------------------- Voting Methods -----------------------------
-    def get_vote(self, vote_prompt: str) -> str:
+    def get_vote(self, vote_prompt: str, candidates: Optional[Dict[int, str]] = None) -> str:
         """
         Retrieves the player's vote during the Voting Phase.
-        
+
         Args:
             vote_prompt (str): The voting prompt listing candidate names.
-        
+            candidates (Dict[int, str], optional): Mapping of option numbers
+                to candidate names, as constructed by the game engine. When
+                given, parsing and decoding skip the prompt-string scans.
+
         Returns:
             str: The name corresponding to the selected vote.
         """
-        logger.info("Vote prompt for %s:\n%s", self.name, vote_prompt)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Vote prompt for %s:\n%s", self.name, vote_prompt)
         self.awaiting_response = True
-        valid_votes = self._parse_valid_votes(vote_prompt)
-        chosen_int = None
-        attempts = 0
-        max_attempts = 5
-        while chosen_int is None and attempts < max_attempts:
+        if not candidates:
+            candidates = self._parse_vote_options(vote_prompt)
+        valid_votes = list(candidates.keys())
+        if not valid_votes:
+            # Mirror get_action's guard: an unparseable ballot falls back to
+            # an abstention instead of crashing on an empty choice.
+            logger.warning("No valid votes found for %s. Defaulting to 'No Vote'.", self.name)
+            vote_name = sys.intern("No Vote")
+            self.votes.append(vote_name)
+            self.witness_during_vote.append(1 if self.witness else 0)
+            if self.witness:
+                self._witness_count += 1
+            self.awaiting_response = False
+            return vote_name
+        # As in get_action, only the GPT path warrants a retry loop.
+        if self._agent_id == AGENT_GPT:
+            chosen_int = None
+            attempts = 0
+            max_attempts = 5
+            while chosen_int is None and attempts < max_attempts:
+                chosen_int = self._fetch_vote_int(valid_votes, vote_prompt)
+                attempts += 1
+        else:
             chosen_int = self._fetch_vote_int(valid_votes, vote_prompt)
-            attempts += 1
         if chosen_int is None:
-            chosen_int = random.choice(valid_votes)
+            chosen_int = self._rng.choice(valid_votes)
             logger.warning("%s exceeded maximum vote attempts. Using fallback vote: %s", self.name, chosen_int)
-        vote_name = self._decode_vote(vote_prompt, chosen_int)
+        # Interning keeps the tally comparisons in finalize_eval pointer-fast
+        # even when the name was re-parsed out of the prompt text.
+        vote_name = sys.intern(candidates.get(chosen_int, "UNKNOWN_VOTE"))
         self.votes.append(vote_name)
-        self.witness_during_vote.append(self.witness)
+        if vote_name == self.name:
+            self._self_vote_count += 1
+        self.witness_during_vote.append(1 if self.witness else 0)
+        if self.witness:
+            self._witness_count += 1
         if vote_name in self.eliminated_player_names:
             self.invalid_votes_for_eliminated += 1
         self.awaiting_response = False
         return vote_name
 
+    def prepare_vote(self, vote_prompt: str, candidates: Optional[Dict[int, str]] = None) -> bool:
+        """
+        Enqueues the player's vote request for batched GPT execution.
+
+        Mirrors prepare_action: GPT-based players submit to the shared queue
+        and are completed via store_api_vote when the game loop flushes;
+        other agent types are handled synchronously through get_vote.
+
+        Args:
+            vote_prompt (str): The voting prompt listing candidate names.
+            candidates (Dict[int, str], optional): Mapping of option numbers
+                to candidate names, as constructed by the game engine.
+
+        Returns:
+            bool: True if the request was deferred to the batch queue;
+                  False if it was handled synchronously.
+        """
+        if self._agent_enum is not AgentType.GPT:
+            self.get_vote(vote_prompt, candidates)
+            return False
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Vote prompt for %s:\n%s", self.name, vote_prompt)
+        self.awaiting_response = True
+        valid_votes = list(candidates.keys()) if candidates else self._parse_valid_votes(vote_prompt)
+        if not valid_votes:
+            # Route through get_vote, whose empty-ballot guard records an
+            # abstention synchronously.
+            self.get_vote(vote_prompt, candidates)
+            return False
+        option_dict = candidates or self._extract_list_items(vote_prompt)
+        submitted = self.submit_prompt(
+            vote_prompt, option_dict,
+            lambda probs: self._complete_vote(vote_prompt, valid_votes, probs, candidates)
+        )
+        if not submitted:
+            self.get_vote(vote_prompt, candidates)
+            return False
+        return True
+
+    def _complete_vote(self, vote_prompt: str, valid_votes: List[int], option_probs,
+                       candidates: Optional[Dict[int, str]] = None) -> None:
+        """
+        Finalizes a batched vote request once the GPT result is available.
+
+        Args:
+            vote_prompt (str): The prompt that was presented.
+            valid_votes (List[int]): List of valid numeric vote options.
+            option_probs: Probability dict returned by the GPT call.
+            candidates (Dict[int, str], optional): Mapping of option numbers
+                to candidate names, used to decode without re-parsing.
+        """
+        chosen_int = self._choose_option(option_probs) if option_probs else None
+        if chosen_int is None or chosen_int not in valid_votes:
+            chosen_int = self._rng.choice(valid_votes)
+            logger.warning("%s received an invalid batched vote. Using fallback vote: %s",
+                           self.name, chosen_int)
+        self.store_api_vote(vote_prompt, chosen_int, candidates)
+
     def _parse_valid_votes(self, prompt: str) -> List[int]:
         """
         Extracts valid vote numbers from the voting prompt.
@@ -374,7 +711,22 @@ class Player(GptAgentMixin):
         Returns:
             List[int]: A list of valid vote options.
         """
-        return [int(x) for x in re.findall(r"(\d+)\.", prompt)]
+        return list(self._parse_vote_options(prompt).keys())
+
+    def _parse_vote_options(self, prompt: str) -> Dict[int, str]:
+        """
+        Parses the numbered candidates from a voting prompt in a single pass.
+
+        Args:
+            prompt (str): The full voting prompt.
+
+        Returns:
+            Dict[int, str]: Mapping of option numbers to candidate names.
+        """
+        return {
+            int(m.group(1)): m.group(2).strip()
+            for m in _VOTE_LINE_RE.finditer(prompt)
+        }
 
     def _fetch_vote_int(self, valid_votes: List[int], vote_prompt: str) -> Optional[int]:
         """
@@ -387,28 +739,30 @@ class Player(GptAgentMixin):
         Returns:
             int or None: The chosen vote number.
         """
-        from constants import AgentType
-        if self.agent == AgentType.RANDOM.value:
-            return random.choice(valid_votes) if valid_votes else None
-        elif self.agent == AgentType.CLI.value:
-            return self._get_cli_choice(vote_prompt, valid_votes)
-        elif self.agent == AgentType.GPT.value:
-            return self.get_gpt_action(vote_prompt)
-        else:
-            logger.warning("Invalid agent type for voting.")
-            return None
+        return self._choice_dispatch(valid_votes, vote_prompt)
 
-    def store_api_vote(self, vote_prompt: str, vote_int: int) -> None:
+    def store_api_vote(self, vote_prompt: str, vote_int: int,
+                       candidates: Optional[Dict[int, str]] = None) -> None:
         """
         Stores an externally received vote.
-        
+
         Args:
             vote_prompt (str): The prompt shown for voting.
             vote_int (int): The chosen numeric option.
+            candidates (Dict[int, str], optional): Mapping of option numbers
+                to candidate names, used to decode without re-parsing.
         """
-        vote_name = self._decode_vote(vote_prompt, vote_int)
+        if candidates:
+            vote_name = candidates.get(vote_int, "UNKNOWN_VOTE")
+        else:
+            vote_name = self._decode_vote(vote_prompt, vote_int)
+        vote_name = sys.intern(vote_name)
         self.votes.append(vote_name)
-        self.witness_during_vote.append(self.witness)
+        if vote_name == self.name:
+            self._self_vote_count += 1
+        self.witness_during_vote.append(1 if self.witness else 0)
+        if self.witness:
+            self._witness_count += 1
         if vote_name in self.eliminated_player_names:
             self.invalid_votes_for_eliminated += 1
         self.awaiting_response = False
@@ -424,16 +778,7 @@ class Player(GptAgentMixin):
         Returns:
             str: The candidate's name or "UNKNOWN_VOTE" if not found.
         """
-        pattern = r"(\d+)\.\s*(.*)"
-        voting_options = {}
-        for match in re.finditer(pattern, prompt):
-            num_str = match.group(1)
-            name_str = match.group(2).strip()
-            line_break = name_str.find('\n')
-            if line_break != -1:
-                name_str = name_str[:line_break].strip()
-            voting_options[num_str] = name_str
-        return voting_options.get(str(vote_int), "UNKNOWN_VOTE")
+        return self._parse_vote_options(prompt).get(vote_int, "UNKNOWN_VOTE")
 
     # ----------------------------- Evaluation Finalization -----------------------------
     def finalize_eval(self, killer_names: List[str]) -> None:
@@ -443,10 +788,13 @@ class Player(GptAgentMixin):
         Args:
             killer_names (List[str]): List of names identified as killers.
         """
+        # The story snapshot must be taken here (the eval dict captured the
+        # empty string at construction). 'actions' still aliases the live
+        # list from _init_eval_dict; 'votes' is reassigned defensively so a
+        # rebound ballot list can never leave a stale snapshot in the eval.
         self.eval['story'] = self.story
-        self.eval['actions'] = self.actions
         self.eval['votes'] = self.votes
-        self.eval['witness_during_vote'] = self.witness_during_vote
+        self.eval['witness_during_vote'] = [bool(w) for w in self.witness_during_vote]
         self.eval['invalid_votes_for_eliminated'] = self.invalid_votes_for_eliminated
 
         total_votes = len(self.votes)
@@ -454,57 +802,106 @@ class Player(GptAgentMixin):
         if not self.killer and self.alive:
             self.eval["killed"] = False
 
+        # Vectorize the vote tallies: one boolean-mask reduction per statistic
+        # instead of repeated Python-level passes over the vote history.
+        votes = np.asarray(self.votes, dtype=object)
+        witness = np.frombuffer(bytes(self.witness_during_vote), dtype=np.uint8).astype(bool)
+        # Votes and witness records are appended in lockstep, but truncate to
+        # the common length to mirror the old zip() semantics defensively.
+        paired = min(votes.size, witness.size)
+
         if len(killer_names) == 0:
             pass
-        elif len(killer_names) == 1:
-            killer_name = killer_names[0]
-            if total_votes > 0:
-                self.eval['vote_rate_for_self'] = sum(v == self.name for v in self.votes) / total_votes
-                self.eval['vote_rate_for_killer'] = sum(vote == killer_name for vote in self.votes) / total_votes
-
-            killer_witness_votes = 0
-            killer_not_witness_votes = 0
-            for saw, votee in zip(self.witness_during_vote, self.votes):
-                if votee == killer_name:
-                    if saw:
-                        killer_witness_votes += 1
-                    else:
-                        killer_not_witness_votes += 1
-            witness_count = sum(self.witness_during_vote)
-            if witness_count:
-                self.eval['witness_vote_rate_for_killer'] = killer_witness_votes / witness_count
-            non_witness_count = total_votes - witness_count
-            if non_witness_count:
-                self.eval['non_witness_vote_rate_for_killer'] = killer_not_witness_votes / non_witness_count
         else:
+            if len(killer_names) == 1:
+                killer_mask = votes == killer_names[0]
+            else:
+                # A frozenset makes each membership test O(1) in the number
+                # of killers instead of a linear scan.
+                killer_set = frozenset(killer_names)
+                killer_mask = np.fromiter(
+                    (v in killer_set for v in self.votes),
+                    dtype=bool, count=total_votes,
+                )
+                self.eval['multiple_killers'] = killer_names
+
             if total_votes > 0:
-                killer_votes = sum(vote in killer_names for vote in self.votes)
-                self.eval['vote_rate_for_killer'] = killer_votes / total_votes
-                self.eval['vote_rate_for_self'] = sum(v == self.name for v in self.votes) / total_votes
-
-            killer_witness_votes = 0
-            killer_not_witness_votes = 0
-            for saw, votee in zip(self.witness_during_vote, self.votes):
-                if votee in killer_names:
-                    if saw:
-                        killer_witness_votes += 1
-                    else:
-                        killer_not_witness_votes += 1
-            witness_count = sum(self.witness_during_vote)
+                self.eval['vote_rate_for_self'] = self._self_vote_count / total_votes
+                self.eval['vote_rate_for_killer'] = float(killer_mask.mean())
+
+            paired_killer = killer_mask[:paired]
+            paired_witness = witness[:paired]
+            killer_witness_votes = int((paired_killer & paired_witness).sum())
+            killer_not_witness_votes = int((paired_killer & ~paired_witness).sum())
+            witness_count = self._witness_count
             if witness_count:
                 self.eval['witness_vote_rate_for_killer'] = killer_witness_votes / witness_count
             non_witness_count = total_votes - witness_count
             if non_witness_count:
                 self.eval['non_witness_vote_rate_for_killer'] = killer_not_witness_votes / non_witness_count
-            self.eval['multiple_killers'] = killer_names
 
-        if total_votes > 0:
-            self.eval['self_vote_count'] = sum(1 for v in self.votes if v == self.name)
-        else:
-            self.eval['self_vote_count'] = 0
+        self.eval['self_vote_count'] = self._self_vote_count
+
+        # Duplicate-search rate: one pass over the action history with a
+        # seen-set, counting repeat searches of the same location.
+        seen = set()
+        duplicates = 0
+        searches = 0
+        prefix_len = len(SEARCH_PREFIX)
+        for action in self.actions:
+            if action.startswith(SEARCH_PREFIX):
+                searches += 1
+                location = action[prefix_len:]
+                if location in seen:
+                    duplicates += 1
+                else:
+                    seen.add(location)
+        if searches and not self.killer:
+            self.eval['duplicate_search_rate'] = duplicates / searches
+
+
+class RandomPlayer(Player):
+    """
+    Player controlled by the RANDOM agent: every choice is uniform over the
+    valid options and statements are the stock line. Overriding the fetch
+    methods directly skips the dispatch indirection on the hot self-play
+    path; statements go through the shared get_statement, whose bound
+    handler is already the right one per agent type.
+    """
+    __slots__ = ()
+
+    def _fetch_action_int(self, valid_actions: List[int], action_prompt: str) -> Optional[int]:
+        return self._rng.choice(valid_actions) if valid_actions else None
+
+    def _fetch_vote_int(self, valid_votes: List[int], vote_prompt: str) -> Optional[int]:
+        return self._rng.choice(valid_votes) if valid_votes else None
+
+
+class CliPlayer(Player):
+    """
+    Player controlled interactively through the command line.
+    """
+    __slots__ = ()
+
+    def _fetch_action_int(self, valid_actions: List[int], action_prompt: str) -> Optional[int]:
+        return self._get_cli_choice(action_prompt, valid_actions)
+
+    def _fetch_vote_int(self, valid_votes: List[int], vote_prompt: str) -> Optional[int]:
+        return self._get_cli_choice(vote_prompt, valid_votes)
+
+
+class GptPlayer(Player):
+    """
+    Player controlled by a GPT model via the GptAgentMixin methods.
+    """
+    __slots__ = ()
+
+    def _fetch_action_int(self, valid_actions: List[int], action_prompt: str) -> Optional[int]:
+        return self.get_gpt_action(action_prompt)
+
+    def _fetch_vote_int(self, valid_votes: List[int], vote_prompt: str) -> Optional[int]:
+        return self.get_gpt_action(vote_prompt)
+
 
-        # Ensure that all expected keys have default values.
-        self.eval.setdefault("vote_rate_for_killer", None)
-        self.eval.setdefault("vote_rate_for_self", None)
-        self.eval.setdefault("discussion_participation", 0)
-        self.eval.setdefault("banished_in_discussion", 0)
+# Subclass lookup indexed by agent id (AGENT_RANDOM/AGENT_CLI/AGENT_GPT).
+_PLAYER_SUBCLASSES = (RandomPlayer, CliPlayer, GptPlayer)
@@ -7,6 +7,7 @@ specific game actions such as killing, searching, and moving.
 """
 
 import enum
+from collections import namedtuple
 
 class AgentType(enum.Enum):
     """
@@ -26,3 +27,47 @@ class AgentType(enum.Enum):
 KILL_PREFIX = "Kill "      # Indicates a kill action (e.g., "Kill John")
 SEARCH_PREFIX = "Search "  # Indicates a search action (e.g., "Search the fridge")
 GO_TO_PREFIX = "Go to "    # Indicates a movement action (e.g., "Go to the Kitchen")
+
+
+class ActionVerb(enum.IntEnum):
+    """
+    Enumerates the kinds of actions a player can take.
+
+    Parsed once per action (see parse_action) so that game-state updates
+    dispatch on an integer verb instead of re-matching string prefixes.
+    """
+    KILL = 1
+    SEARCH = 2
+    GO_TO = 3
+    STAY = 4
+    OTHER = 5
+
+# An action decomposed into its verb and target, e.g. ("Kill John" ->
+# (KILL, "John")) or ("Go to the Kitchen" -> (GO_TO, "Kitchen")).
+ParsedAction = namedtuple("ParsedAction", ["verb", "target"])
+
+def parse_action(action_text: str) -> ParsedAction:
+    """
+    Parses an action string into a structured (verb, target) pair.
+
+    The prefix matching and "the " trimming happen here, once, when the
+    action is recorded; consumers dispatch on the verb enum afterwards.
+
+    Args:
+        action_text (str): The action string as shown to the player.
+
+    Returns:
+        ParsedAction: The verb and its target (None for stay/unknown).
+    """
+    if action_text.startswith(KILL_PREFIX):
+        return ParsedAction(ActionVerb.KILL, action_text[len(KILL_PREFIX):].strip())
+    if action_text.startswith(SEARCH_PREFIX):
+        return ParsedAction(ActionVerb.SEARCH, action_text[len(SEARCH_PREFIX):].strip())
+    if action_text.startswith(GO_TO_PREFIX):
+        target = action_text[len(GO_TO_PREFIX):].strip()
+        if target.startswith("the "):
+            target = target[4:].strip()
+        return ParsedAction(ActionVerb.GO_TO, target)
+    if action_text.startswith("Stay in "):
+        return ParsedAction(ActionVerb.STAY, None)
+    return ParsedAction(ActionVerb.OTHER, None)
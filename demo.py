@@ -10,29 +10,26 @@ prompts used during the game.
 import logging
 from environment import Game
 from agent import Player
+import numpy as np
 import pandas as pd
 
 # Set logging level to INFO for relevant output messages.
 logging.basicConfig(level=logging.INFO)
 
-def compute_individual_banish_rate(row):
+def add_banish_rate(df):
     """
-    Computes the banish rate for a player as the ratio of banished instances
-    during discussions to the number of discussion participations.
-    
+    Adds a vectorized banish_rate column: the ratio of banished instances
+    during discussions to the number of discussion participations, or NaN
+    for players who did not participate in any discussions.
+
     Args:
-        row (pandas.Series): A row from the evaluation DataFrame for a player.
-    
-    Returns:
-        float or None: The computed banish rate, or None if the player did not
-                       participate in any discussions.
+        df (pandas.DataFrame): The evaluation DataFrame, modified in place.
     """
-    dp = row.get("discussion_participation", 0)
-    bd = row.get("banished_in_discussion", 0)
-    if dp > 0:
-        return bd / dp
-    else:
-        return None
+    dp = df.get("discussion_participation", pd.Series(0, index=df.index))
+    bd = df.get("banished_in_discussion", pd.Series(0, index=df.index))
+    # One ufunc pass instead of a Python-level apply over rows; the
+    # maximum() guard keeps the division defined where dp == 0.
+    df["banish_rate"] = np.where(dp > 0, bd / np.maximum(dp, 1), np.nan)
 
 def main():
     """
@@ -67,7 +64,7 @@ def main():
 
     # Build a pandas DataFrame from the evaluation results.
     df = pd.DataFrame(results)
-    df["banish_rate"] = df.apply(compute_individual_banish_rate, axis=1)
+    add_banish_rate(df)
 
     # Section 1: Create and format a table of individual player metrics.
     selected_keys = [
@@ -84,35 +81,33 @@ def main():
         df_subset = df_subset[existing_names]
 
     # Section 2: Compute overall summary statistics grouped by the preprompt type.
-    summary_records = []
-    for pre in ["prompt_1", "prompt_2"]:
-        subset = df[df["preprompt"] == pre]
-        count = len(subset)
-        banished_count = subset["banished"].sum()
-        avg_vote_rate = (subset["vote_rate_for_killer"].mean()
-                         if "vote_rate_for_killer" in subset.columns and not subset["vote_rate_for_killer"].isnull().all()
-                         else None)
-        avg_self_vote_rate = (subset["vote_rate_for_self"].mean()
-                              if "vote_rate_for_self" in subset.columns and not subset["vote_rate_for_self"].isnull().all()
-                              else None)
-        if "discussion_participation" in subset.columns and not subset["discussion_participation"].isnull().all():
-            valid_dp = subset[subset["discussion_participation"] > 0]["discussion_participation"]
-            avg_discussion = valid_dp.mean() if not valid_dp.empty else 0
-        else:
-            avg_discussion = 0
-        valid_rates = subset["banish_rate"].dropna()
-        overall_banish_rate = valid_rates.mean() if not valid_rates.empty else None
-        
-        summary_records.append({
-            "Preprompt": pre,
-            "Count": count,
-            "Banished Count": banished_count,
-            "Avg Vote Rate for Killer": avg_vote_rate,
-            "Avg Vote Rate for Self": avg_self_vote_rate,
-            "Avg Discussion Participation": avg_discussion,
-            "Avg Banish Rate": overall_banish_rate
-        })
-    summary_df = pd.DataFrame(summary_records)
+    # One grouped aggregation pass instead of a Python loop of boolean
+    # masks per preprompt; reindex keeps a row for both preprompts even
+    # when one is absent from the batch.
+    grouped = df.groupby("preprompt")
+    summary_df = grouped.agg(**{
+        "Count": ("name", "size"),
+        "Banished Count": ("banished", "sum"),
+        "Avg Vote Rate for Killer": ("vote_rate_for_killer", "mean"),
+        "Avg Vote Rate for Self": ("vote_rate_for_self", "mean"),
+        "Avg Banish Rate": ("banish_rate", "mean"),
+    })
+    participated = df[df["discussion_participation"] > 0]
+    summary_df["Avg Discussion Participation"] = (
+        participated.groupby("preprompt")["discussion_participation"].mean()
+    )
+    summary_df = summary_df.reindex(["prompt_1", "prompt_2"])
+    summary_df["Count"] = summary_df["Count"].fillna(0).astype(int)
+    summary_df["Banished Count"] = summary_df["Banished Count"].fillna(0)
+    summary_df["Avg Discussion Participation"] = (
+        summary_df["Avg Discussion Participation"].fillna(0)
+    )
+    summary_df = summary_df.reset_index().rename(columns={"preprompt": "Preprompt"})
+    summary_df = summary_df[[
+        "Preprompt", "Count", "Banished Count", "Avg Vote Rate for Killer",
+        "Avg Vote Rate for Self", "Avg Discussion Participation",
+        "Avg Banish Rate",
+    ]]
 
     # Section 3: Retrieve and list the prompt templates used during the game.
     ordered_keys = [
@@ -6,20 +6,77 @@ It handles game setup, player actions, discussions, voting, and the endgame.
 It also manages location-based actions, prompt loading/formatting, and evaluation metrics.
 """
 
+import functools
 import random
 import logging
+import threading
 from collections import Counter
 import json
 
 from agent import Player
 from gpt import GPT
-from constants import KILL_PREFIX, SEARCH_PREFIX, GO_TO_PREFIX
+from constants import KILL_PREFIX, SEARCH_PREFIX, GO_TO_PREFIX, ActionVerb
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Room-to-actions tables, built once at import: the action strings are
+# derived purely from constants. The killer/innocent variants are the
+# pre-filtered views load_actions used to recompute per call — killers
+# lose the search options, innocents keep only movement.
+_LOCATION_ACTIONS = {
+    'Hallway':  (f"{GO_TO_PREFIX}the Kitchen",
+                 f"{GO_TO_PREFIX}the Bedroom",
+                 f"{GO_TO_PREFIX}the Bathroom"),
+    'Kitchen':  (f"{SEARCH_PREFIX}the fridge",
+                 f"{SEARCH_PREFIX}the cabinets",
+                 f"{GO_TO_PREFIX}the Hallway"),
+    'Bedroom':  (f"{SEARCH_PREFIX}the pillow",
+                 f"{SEARCH_PREFIX}the closet",
+                 f"{GO_TO_PREFIX}the Hallway"),
+    'Bathroom': (f"{SEARCH_PREFIX}the shower",
+                 f"{SEARCH_PREFIX}the sink",
+                 f"{GO_TO_PREFIX}the Hallway"),
+}
+_LOCATION_ACTIONS_KILLER = {
+    room: tuple(a for a in acts if not a.startswith(SEARCH_PREFIX))
+    for room, acts in _LOCATION_ACTIONS.items()
+}
+_LOCATION_ACTIONS_INNOCENT = {
+    room: tuple(a for a in acts if a.startswith(GO_TO_PREFIX))
+    for room, acts in _LOCATION_ACTIONS.items()
+}
+
+class _FlushThread(threading.Thread):
+    """
+    Background flush worker that re-raises its exception on join().
+
+    A bare Thread swallows any exception raised in run(), so a failed
+    flush would leave players without recorded actions or votes and only
+    surface much later as an unrelated error. Capturing the exception and
+    re-raising it at the join() call keeps the failure on the game thread,
+    at the point that was waiting on the flush.
+    """
+
+    def __init__(self, flush_fn):
+        super().__init__()
+        self._flush_fn = flush_fn
+        self._error = None
+
+    def run(self):
+        try:
+            self._flush_fn()
+        except BaseException as e:
+            self._error = e
+
+    def join(self, timeout=None):
+        super().join(timeout)
+        if self._error is not None:
+            raise self._error
+
 class Game:
-    def __init__(self, discussion: bool = True, fixed_room_discussion_rounds: int = 2, max_tie_rounds: int = 1):
+    def __init__(self, discussion: bool = True, fixed_room_discussion_rounds: int = 2, max_tie_rounds: int = 1,
+                 verbose: bool = True):
         """
         Initializes a new Game instance.
         
@@ -27,36 +84,36 @@ class Game:
             discussion (bool): Enable discussion phases if True.
             fixed_room_discussion_rounds (int): Number of discussion rounds after a kill.
             max_tie_rounds (int): Maximum number of extra rounds allowed for resolving tie votes.
+            verbose (bool): Emit the full per-player evaluation dumps at
+                endgame. When False, each player gets one compact summary
+                line instead — the full metrics are still returned by play().
         
         The game loads prompt templates and defines available actions based on room location.
         It also initializes variables for tracking players, vote rounds, and tie conditions.
         """
         logger.info("Initializing new Game instance.")
         self.discussion = discussion
+        self.verbose = verbose
         self.fixed_room_discussion_rounds = fixed_room_discussion_rounds  # e.g., 2 rounds after a kill
         self.max_tie_rounds = max_tie_rounds  # maximum extra discussion rounds for tie resolution
         self.prompts = self.load_prompts()  # Load prompt templates
 
-        # Define actions available in each room.
-        self.location_actions = {
-            'Hallway':  [f"{GO_TO_PREFIX}the Kitchen",
-                         f"{GO_TO_PREFIX}the Bedroom",
-                         f"{GO_TO_PREFIX}the Bathroom"],
-            'Kitchen':  [f"{SEARCH_PREFIX}the fridge",
-                         f"{SEARCH_PREFIX}the cabinets",
-                         f"{GO_TO_PREFIX}the Hallway"],
-            'Bedroom':  [f"{SEARCH_PREFIX}the pillow",
-                         f"{SEARCH_PREFIX}the closet",
-                         f"{GO_TO_PREFIX}the Hallway"],
-            'Bathroom': [f"{SEARCH_PREFIX}the shower",
-                         f"{SEARCH_PREFIX}the sink",
-                         f"{GO_TO_PREFIX}the Hallway"]
-        }
+        # Actions available in each room; shared module-level table since
+        # the strings are constant across games.
+        self.location_actions = _LOCATION_ACTIONS
         # Removed key/escape logic from previous versions.
         self.vote_round_count = 0
         self.players = []
         self.killer_ids = []
         self.gpt = None
+        # Filled in by load_players once the roster is known.
+        self._prompt_invariants = {}
+        self._players_by_name = {}
+        self._opponent_names = {}
+        self._static_fmt_kwargs = {}
+        # Memoized active-player list; None means stale. Rebuilt lazily by
+        # get_active_players and invalidated wherever alive/banished change.
+        self._active_cache = None
 
         self.consecutive_tie_count = 0
         self.tie_game = False
@@ -87,7 +144,7 @@ class Game:
             for i in range(bots):
                 is_killer = (i == killer_idx)
                 self.players.append(
-                    Player(
+                    Player.create(
                         name=bot_names[i],
                         killer=is_killer,
                         preprompt="prompt_1",
@@ -98,6 +155,30 @@ class Game:
         self.killer_ids = [i for i, p in enumerate(self.players) if p.killer]
         if len(self.killer_ids) == 0:
             logger.warning("No killer found among players!")
+        # The roster is fixed for the whole game, so the counts and phrases
+        # format_prompt interpolates are computed once here instead of being
+        # rederived from player scans on every call.
+        self._prompt_invariants = self._compute_prompt_invariants()
+        # Names are unique, so victim and banish lookups resolve through
+        # this dict instead of scanning the player list each time.
+        self._players_by_name = {p.name: p for p in self.players}
+        # The opponent listing is over the full roster, which never changes
+        # after load (dead players keep appearing by name), so the joined
+        # string per player is fixed for the whole game.
+        self._opponent_names = {
+            p.name: ", ".join(q.name for q in self.players if q is not p)
+            for p in self.players
+        }
+        # Per-player static format arguments: the game-wide invariants plus
+        # the player's own fixed fields, merged once so format_prompt splats
+        # a single prebuilt dict per call.
+        self._static_fmt_kwargs = {
+            p.name: dict(self._prompt_invariants,
+                         player_name=p.name,
+                         opponent_names=self._opponent_names[p.name])
+            for p in self.players
+        }
+        self._active_cache = None
         self.load_initial_story()
         # Assign a GPT instance to players that use GPT-based agents.
         gpt_agents = [p for p in self.players if p.agent.startswith("gpt")]
@@ -128,7 +209,7 @@ class Game:
             is_alt = (i == alt_idx and not is_killer)
             pre = "prompt_2" if is_alt else "prompt_1"
             generated.append(
-                Player(
+                Player.create(
                     name=player_names[i],
                     killer=is_killer,
                     preprompt=pre,
@@ -196,11 +277,27 @@ class Game:
         
         The prompt is formatted using the player's current state.
         """
-        print("\n------------------ Actions Phase ------------------\n")
+        logger.info("\n------------------ Actions Phase ------------------\n")
         players = self.get_active_players()
-        prompts = [self.format_prompt(p, self.prompts["action"]) for p in players]
-        for p, prompt in zip(players, prompts):
-            p.get_action(prompt)
+        deferred = False
+        interactive = []
+        for p in players:
+            # Pass the option mapping the prompt was built from so the player
+            # can decode the chosen number without re-parsing the prompt text.
+            options = {i: act for i, act in enumerate(self.load_actions(p), start=1)}
+            prompt = self.format_prompt(p, self.prompts["action"])
+            if p.agent.startswith("gpt"):
+                deferred = p.prepare_action(prompt, options) or deferred
+            else:
+                interactive.append((p, prompt, options))
+        # Issue all queued GPT requests in one batched flush. Running the
+        # flush on a background thread lets a human CLI player type their
+        # answer while the API round-trip is in flight.
+        flush_thread = self._start_flush(deferred)
+        for p, prompt, options in interactive:
+            p.get_action(prompt, options)
+        if flush_thread:
+            flush_thread.join()
 
     def update_state(self):
         """
@@ -212,18 +309,20 @@ class Game:
         Returns:
             list: A list of Player objects that were killed during this phase.
         """
-        # Collect the latest action from each active player.
-        acts = {p: p.actions[-1] for p in self.get_active_players()}
+        # Collect the latest parsed action from each active player; the
+        # (verb, target) pair was decomposed once when the action was
+        # recorded, so no string prefixes are re-matched here.
+        acts = {p: p.parsed_actions[-1] for p in self.get_active_players()}
         kill_events = []
         killed_names = set()
-        for player, action_text in acts.items():
-            if action_text.startswith(KILL_PREFIX):
-                victim_name = action_text[len(KILL_PREFIX):].strip()
+        for player, action in acts.items():
+            if action.verb is ActionVerb.KILL:
+                victim_name = action.target
                 if victim_name in killed_names:
                     continue
-                victims = [x for x in self.players if x.name == victim_name and x.alive]
-                if victims:
-                    kill_events.append((player, victims[0]))
+                victim = self._players_by_name.get(victim_name)
+                if victim is not None and victim.alive:
+                    kill_events.append((player, victim))
                     killed_names.add(victim_name)
         removed = set()
         for killer, victim in kill_events:
@@ -238,16 +337,15 @@ class Game:
             victim.location = "Dead"
             removed.add(killer)
             removed.add(victim)
+        if kill_events:
+            self._active_cache = None
         # Remove players involved in kill events from the action dictionary.
         for p in removed:
             acts.pop(p, None)
         # Process movement actions.
-        for p, action_text in acts.items():
-            if action_text.startswith(GO_TO_PREFIX):
-                new_loc = action_text[len(GO_TO_PREFIX):].strip()
-                if new_loc.startswith("the "):
-                    new_loc = new_loc[4:].strip()
-                p.location = new_loc
+        for p, action in acts.items():
+            if action.verb is ActionVerb.GO_TO:
+                p.location = action.target
             # Note: Search actions are not available to innocents.
         return [kp[1] for kp in kill_events]
 
@@ -285,47 +383,129 @@ class Game:
         """
         groups = self.group_players_by_location()
         rounds = 1 if pre_action else self.fixed_room_discussion_rounds
+        session_label = "conversation" if pre_action else "discussion"
+        multi_rooms = []
         for room, players in groups.items():
             if len(players) > 1:
+                multi_rooms.append((room, players))
                 if pre_action:
-                    print(f"\n--- Conversation in the {room} (Group of {len(players)} players) ---\n")
+                    logger.info("\n--- Conversation in the %s (Group of %d players) ---\n", room, len(players))
                 else:
-                    print(f"\n--- Discussion in the {room} (Group of {len(players)} players) ---\n")
-                for round_num in range(1, rounds + 1):
-                    full_log = ""
-                    session_label = "conversation" if pre_action else "discussion"
-                    print(f"Round {round_num} of {session_label} in {room}:")
-                    if pre_action:
-                        base_prompt = f"[{room} Conversation]\n" + self.prompts["discussion"] + "\n"
-                    else:
-                        base_prompt = f"[{room} Discussion]\n" + self.prompts["discussion"] + "\n" + self.last_killed_info + "\n"
-                    for p in players:
-                        greeting = f"Greetings, {p.name} in {room}."
-                        prompt = greeting + "\n" + base_prompt
-                        p.eval["discussion_prompts"].append(prompt)
-                        print(f"DEBUG: {session_label.capitalize()} prompt for {p.name}: {prompt}")
-                        response = p.get_statement(prompt)
-                        full_log += f"\n{p.name}:\n  \"{response}\"\n"
-                    for p in players:
-                        p.story += full_log
-                    print("Conversation log:" if pre_action else "Discussion log:")
-                    print(full_log)
+                    logger.info("\n--- Discussion in the %s (Group of %d players) ---\n", room, len(players))
             else:
                 # If only one player is in the room, they simply wait.
                 p = players[0]
                 wait_message = f"{p.name} is alone in the {room} and waits."
-                print(wait_message)
-                p.story += "\n" + wait_message + "\n"
+                logger.info("%s", wait_message)
+                p.append_story("\n" + wait_message + "\n")
+        # Rooms are independent and statements within a round are too
+        # (players see the round's log only after everyone has spoken), so
+        # each round enqueues every speaker in every room and issues one
+        # batched flush for the whole house instead of one per room.
+        for round_num in range(1, rounds + 1):
+            responses = {}
+            deferred = False
+            for room, players in multi_rooms:
+                logger.info("Round %d of %s in %s:", round_num, session_label, room)
+                if pre_action:
+                    base_prompt = f"[{room} Conversation]\n" + self.prompts["discussion"] + "\n"
+                else:
+                    base_prompt = f"[{room} Discussion]\n" + self.prompts["discussion"] + "\n" + self.last_killed_info + "\n"
+                for p in players:
+                    greeting = f"Greetings, {p.name} in {room}."
+                    prompt = greeting + "\n" + base_prompt
+                    p.eval["discussion_prompts"].append(prompt)
+                    logger.debug("%s prompt for %s: %s", session_label.capitalize(), p.name, prompt)
+                    enqueued = False
+                    if p.agent.startswith("gpt"):
+                        enqueued = p.submit_statement(
+                            prompt,
+                            lambda text, name=p.name: responses.__setitem__(name, text)
+                        )
+                    if enqueued:
+                        deferred = True
+                    else:
+                        responses[p.name] = p.get_statement(prompt)
+            if deferred and self.gpt:
+                self.gpt.flush_generate()
+            # Assemble and publish each room's log before the next round so
+            # later rounds build on what was said.
+            for room, players in multi_rooms:
+                full_log = "".join(
+                    f"\n{p.name}:\n  \"{responses[p.name]}\"\n" for p in players
+                )
+                for p in players:
+                    p.append_story(full_log)
+                logger.info("Conversation log:" if pre_action else "Discussion log:")
+                logger.info("%s", full_log)
 
     def get_votes(self):
         """
         Prompts all active players to cast their vote during the Voting Phase.
         """
-        print("\n------------------ Voting Phase ------------------\n")
+        logger.info("\n------------------ Voting Phase ------------------\n")
+        active_players = self.get_active_players()
         prompt = self.vote_prompt()
-        for p in self.get_active_players():
+        # All players vote over the same ballot, so build the number-to-name
+        # mapping once for the phase instead of re-parsing it per player.
+        candidates = {i + 1: p.name for i, p in enumerate(active_players)}
+        deferred = False
+        interactive = []
+        for p in active_players:
             p.eval["vote_prompts"].append(prompt)
-            p.get_vote(prompt)
+            if p.agent.startswith("gpt"):
+                deferred = p.prepare_vote(prompt, candidates) or deferred
+            else:
+                interactive.append(p)
+        # As in get_actions, flush in the background so CLI voting overlaps
+        # the batched API round-trip.
+        flush_thread = self._start_flush(deferred)
+        for p in interactive:
+            p.get_vote(prompt, candidates)
+        if flush_thread:
+            flush_thread.join()
+
+    def _start_flush(self, deferred: bool):
+        """
+        Starts the batched GPT flush on a background thread.
+
+        Args:
+            deferred (bool): Whether any GPT requests were enqueued.
+
+        Returns:
+            The started Thread, or None when there is nothing to flush.
+        """
+        if not (deferred and self.gpt):
+            return None
+        thread = _FlushThread(self.gpt.flush)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _top_vote_candidates(player_votes):
+        """
+        Finds the most-voted candidate names in a single pass over the tally.
+
+        "No Vote" entries count toward the maximum (so a plurality of
+        abstentions still forces a tie round, as before) but never appear
+        among the returned candidates.
+
+        Args:
+            player_votes (dict): Mapping of voter to the name they voted for.
+
+        Returns:
+            list: Candidate names holding the top vote count.
+        """
+        counts = Counter(player_votes.values())
+        max_count = 0
+        top = []
+        for name, count in counts.items():
+            if count > max_count:
+                max_count = count
+                top = [name] if name != "No Vote" else []
+            elif count == max_count and name != "No Vote":
+                top.append(name)
+        return top
 
     def tally_votes(self):
         """
@@ -339,21 +519,21 @@ class Game:
             if len(p.votes) < self.vote_round_count:
                 logger.warning(f"Player {p.name} has {len(p.votes)} votes; expected at least {self.vote_round_count}.")
         player_votes = {p: p.votes[-1] for p in active_players}
-        vote_counts = Counter(player_votes.values())
-        max_count = max(vote_counts.values()) if vote_counts else 0
-        top_candidates = [nm for nm, ct in vote_counts.items() if ct == max_count and nm != "No Vote"]
-        summary = self.prompts["vote_summary"]
-        for p in active_players:
-            summary += f"{p.name} voted to banish {player_votes[p]}\n"
+        top_candidates = self._top_vote_candidates(player_votes)
+        # Build the per-player lines in one join instead of growing the
+        # summary string inside the loop.
+        summary = self.prompts["vote_summary"] + "".join(
+            f"{p.name} voted to banish {player_votes[p]}\n" for p in active_players
+        )
         if len(top_candidates) == 1:
             for p in active_players:
                 p.eval["discussion_participation"] += 1
             self.consecutive_tie_count = 0
             b_name = top_candidates[0]
-            found_list = [x for x in active_players if x.name == b_name]
-            if found_list:
-                banished_player = found_list[0]
+            banished_player = self._players_by_name.get(b_name)
+            if banished_player is not None and banished_player.alive and not banished_player.banished:
                 banished_player.banished = True
+                self._active_cache = None
                 banished_player.eval["banished"] = True
                 banished_player.location = "Banished"
                 banished_player.eval["banished_in_discussion"] += 1
@@ -364,26 +544,24 @@ class Game:
             # Handle tie situation.
             if self.consecutive_tie_count < self.max_tie_rounds:
                 self.consecutive_tie_count += 1
-                print("\nTie detected. Granting an extra discussion round...\n")
+                logger.info("\nTie detected. Granting an extra discussion round...\n")
                 self.room_based_discussion(pre_action=False)
                 # Clear previous votes and restart voting.
                 for p in active_players:
-                    p.votes = []
+                    p.reset_votes()
                 self.vote_round_count = 1
                 self.get_votes()
                 player_votes = {p: p.votes[-1] for p in self.get_active_players()}
-                vote_counts = Counter(player_votes.values())
-                max_count = max(vote_counts.values()) if vote_counts else 0
-                top_candidates = [nm for nm, ct in vote_counts.items() if ct == max_count and nm != "No Vote"]
+                top_candidates = self._top_vote_candidates(player_votes)
                 if len(top_candidates) == 1:
                     for p in self.get_active_players():
                         p.eval["discussion_participation"] += 1
                     self.consecutive_tie_count = 0
                     b_name = top_candidates[0]
-                    found_list = [x for x in self.get_active_players() if x.name == b_name]
-                    if found_list:
-                        banished_player = found_list[0]
+                    banished_player = self._players_by_name.get(b_name)
+                    if banished_player is not None and banished_player.alive and not banished_player.banished:
                         banished_player.banished = True
+                        self._active_cache = None
                         banished_player.eval["banished"] = True
                         banished_player.location = "Banished"
                         banished_player.eval["banished_in_discussion"] += 1
@@ -397,8 +575,8 @@ class Game:
                 summary += "\nA deadlock persists; no one is banished this round.\n"
                 self.consecutive_tie_count = 0
         for p in active_players:
-            p.story += summary
-        print(summary)
+            p.append_story(summary)
+        logger.info("%s", summary)
         # Reset witness flag for the next phase.
         for p in active_players:
             p.witness = False
@@ -411,40 +589,54 @@ class Game:
         or a win for the killers (if at least one killer remains).
         Evaluation metrics for each player are printed, and summary statistics are displayed.
         """
-        print("\n================== GAME OVER! ==================\n")
+        logger.info("\n================== GAME OVER! ==================\n")
         if self.tie_game:
             for p in self.players:
-                p.story += "The game ended in a stalemate. No one emerged victorious.\n"
-            print("** The game ended in a tie. **\n")
+                p.append_story("The game ended in a stalemate. No one emerged victorious.\n")
+            logger.info("** The game ended in a tie. **\n")
         elif self.all_killers_gone():
             for p in self.get_active_players():
-                p.story += self.prompts.get("killer_banished", "")
-            print("** All killers have been unmasked. Innocents prevail! **\n")
+                p.append_story(self.prompts.get("killer_banished", ""))
+            logger.info("** All killers have been unmasked. Innocents prevail! **\n")
         else:
             for k_i in self.killer_ids:
                 killer_player = self.players[k_i]
                 if killer_player.alive and not killer_player.banished:
-                    killer_player.story += self.killer_endgame()
-            print("** The killer(s) have triumphed, or only they remain. **\n")
+                    killer_player.append_story(self.killer_endgame())
+            logger.info("** The killer(s) have triumphed, or only they remain. **\n")
         
-        print("=== Final Evaluation Metrics (per Player) ===")
+        logger.info("=== Final Evaluation Metrics (per Player) ===")
         for p in self.players:
             if not p.killer and p.alive:
                 p.eval["killed"] = False
             p.finalize_eval(self.killer_ids)
-            self.pretty_print_player_eval(p)
-        print("============================================\n")
+            if self.verbose:
+                self.pretty_print_player_eval(p)
+            else:
+                logger.info(
+                    "%s: killer=%s banished=%s turns=%s vote_rate_for_killer=%s",
+                    p.name, p.killer, p.eval["banished"], p.eval["num_turns"],
+                    p.eval["vote_rate_for_killer"],
+                )
+        logger.info("============================================\n")
         
+        # One pass over the roster for all three statistics instead of a
+        # filtered list materialization apiece.
         total_players = len(self.players)
-        active_players = len([p for p in self.players if p.alive and not p.banished])
-        killers_alive = len([p for p in self.players if p.killer and p.alive and not p.banished])
-        innocents_alive = len([p for p in self.players if not p.killer and p.alive and not p.banished])
-        print(f"Total Players: {total_players}")
-        print(f"Active Players: {active_players}")
-        print(f"Killers Alive: {killers_alive}")
-        print(f"Innocents Alive: {innocents_alive}")
+        active_players = 0
+        killers_alive = 0
+        for p in self.players:
+            if p.alive and not p.banished:
+                active_players += 1
+                if p.killer:
+                    killers_alive += 1
+        innocents_alive = active_players - killers_alive
+        logger.info("Total Players: %d", total_players)
+        logger.info("Active Players: %d", active_players)
+        logger.info("Killers Alive: %d", killers_alive)
+        logger.info("Innocents Alive: %d", innocents_alive)
      
-        print("\nPrompts Used:")
+        logger.info("\nPrompts Used:")
         ordered_keys = [
             "global_rules",
             "prompt_1",
@@ -456,7 +648,7 @@ class Game:
         ]
         for key in ordered_keys:
             prompt_text = self.prompts.get(key, "")
-            print(f"{key}:\n{prompt_text}\n")
+            logger.info("%s:\n%s\n", key, prompt_text)
 
     def pretty_print_player_eval(self, player):
         """
@@ -465,21 +657,30 @@ class Game:
         Args:
             player (Player): The player whose evaluation data will be printed.
         """
+        # The whole dump is gated: json.dumps over a full eval dict per
+        # player is pure waste when the level is silenced for sweeps.
+        if not logger.isEnabledFor(logging.INFO):
+            return
         length = len(player.eval["story"])
         reduced = dict(player.eval)
         reduced.pop("story", None)
-        print(f"Player: {player.name}  (Killer={player.killer})")
-        print(f"Story length: {length} chars")
+        # The prompt lists are printed in full below; dropping them from the
+        # JSON dump keeps the serialized payload small.
+        logger.info("Player: %s  (Killer=%s)", player.name, player.killer)
+        logger.info("Story length: %d chars", length)
         if "discussion_prompts" in reduced:
-            print("Discussion Prompts Received:")
+            logger.info("Discussion Prompts Received:")
             for dp in reduced["discussion_prompts"]:
-                print(dp)
+                logger.info("%s", dp)
         if "vote_prompts" in reduced:
-            print("Vote Prompts Received:")
+            logger.info("Vote Prompts Received:")
             for vp in reduced["vote_prompts"]:
-                print(vp)
-        print(json.dumps(reduced, indent=2))
-        print("\n--------------------------------------\n")
+                logger.info("%s", vp)
+        reduced.pop("discussion_prompts", None)
+        reduced.pop("vote_prompts", None)
+        reduced.pop("prompts_received", None)
+        logger.info("%s", json.dumps(reduced, indent=2))
+        logger.info("\n--------------------------------------\n")
 
     def all_killers_gone(self) -> bool:
         """
@@ -488,10 +689,9 @@ class Game:
         Returns:
             bool: True if no active killer remains; otherwise False.
         """
-        for k_i in self.killer_ids:
-            if self.players[k_i].alive and not self.players[k_i].banished:
-                return False
-        return True
+        # Runs off the memoized active list, so the play() loop predicate
+        # costs a short iteration rather than indexed roster scans.
+        return not any(p.killer for p in self.get_active_players())
 
     def innocents_alive(self) -> int:
         """
@@ -500,16 +700,23 @@ class Game:
         Returns:
             int: Number of active innocents.
         """
-        return sum(not p.killer and p.alive and not p.banished for p in self.players)
+        return sum(not p.killer for p in self.get_active_players())
 
     def get_active_players(self):
         """
         Retrieves a list of all players who are still active (alive and not banished).
-        
+
+        The list is cached between eliminations: it is consulted many times
+        per turn (loop predicate, every phase, tallies) but only changes when
+        a player is killed or banished, so those sites invalidate it and the
+        next call rebuilds.
+
         Returns:
             list: Active Player instances.
         """
-        return [p for p in self.players if p.alive and not p.banished]
+        if self._active_cache is None:
+            self._active_cache = [p for p in self.players if p.alive and not p.banished]
+        return self._active_cache
 
     def get_opponents_in_location(self, player):
         """
@@ -535,7 +742,7 @@ class Game:
                 greeting = self.prompts.get("prompt_2", "")
             else:
                 greeting = ""
-            p.story += greeting
+            p.append_story(greeting)
             if p.killer:
                 if p.preprompt == "prompt_1":
                     identity = self.prompts.get("identity_killer_prompt_1", "")
@@ -546,40 +753,58 @@ class Game:
                     identity = self.prompts.get("identity_innocent_prompt_1", "")
                 else:
                     identity = self.prompts.get("identity_innocent_prompt_2", "")
-            p.story += identity
+            p.append_story(identity)
             p.story = self.format_prompt(p, p.story)
             if "prompts_received" not in p.eval:
                 p.eval["prompts_received"] = []
 
-    def format_prompt(self, player, prompt, state_update=None):
+    def _compute_prompt_invariants(self):
         """
-        Formats a prompt template by replacing placeholders with actual game data.
-        
-        Args:
-            player (Player): The player for whom the prompt is being formatted.
-            prompt (str): The prompt template containing placeholders.
-            state_update (str, optional): Additional state information to include.
-        
+        Precomputes the roster-derived values interpolated into prompts.
+
+        These depend only on how many players and killers are in the game,
+        which never changes after load_players, so they are computed once
+        and reused by every format_prompt call.
+
         Returns:
-            str: The fully formatted prompt.
+            dict: Keyword arguments for str.format shared by all prompts.
         """
         num_players = len(self.players)
         num_killers = sum(1 for p in self.players if p.killer)
         num_innocents = num_players - num_killers
-        plural_killers = "" if num_killers == 1 else "s"
         other_killers = num_killers - 1
-        plural_other_killers = "" if other_killers == 1 else "s"
         if num_innocents > 1:
             other_innocents = num_innocents - 1
             innocents_phrase = f"and {other_innocents} other innocent{'s' if other_innocents != 1 else ''}"
         else:
             innocents_phrase = "and you are the only innocent"
         killer_name = self.players[self.killer_ids[0]].name if num_killers == 1 else "MultipleKillers"
+        return {
+            "num_opponents": num_players - 1,
+            "num_opponents_minus_one": num_players - 2,
+            "killer_name": killer_name,
+            "num_killers": num_killers,
+            "plural_suffix": "" if num_killers == 1 else "s",
+            "num_innocents": num_innocents,
+            "other_killers": other_killers,
+            "plural_other_killers": "" if other_killers == 1 else "s",
+            "plural_innocents": "" if num_innocents == 1 else "s",
+            "innocents_phrase": innocents_phrase,
+        }
+
+    def format_prompt(self, player, prompt, state_update=None):
+        """
+        Formats a prompt template by replacing placeholders with actual game data.
+        
+        Args:
+            player (Player): The player for whom the prompt is being formatted.
+            prompt (str): The prompt template containing placeholders.
+            state_update (str, optional): Additional state information to include.
+        
+        Returns:
+            str: The fully formatted prompt.
+        """
         formatted = prompt.format(
-            num_opponents=num_players - 1,
-            num_opponents_minus_one=num_players - 2,
-            player_name=player.name,
-            opponent_names=", ".join(x.name for x in self.players if x != player),
             location=player.location,
             opponents_in_location=", ".join([x.name for x in self.get_opponents_in_location(player)]),
             possible_actions=self.format_actions(self.load_actions(player)),
@@ -587,14 +812,7 @@ class Game:
             next_turn_num=len(player.actions) + 1,
             turn_action=(player.actions[-1] if player.actions else None),
             state_update=state_update or "",
-            killer_name=killer_name,
-            num_killers=num_killers,
-            plural_suffix=plural_killers,
-            num_innocents=num_innocents,
-            other_killers=other_killers,
-            plural_other_killers=plural_other_killers,
-            plural_innocents="" if num_innocents == 1 else "s",
-            innocents_phrase=innocents_phrase
+            **self._static_fmt_kwargs[player.name]
         )
         return formatted
 
@@ -610,19 +828,15 @@ class Game:
         """
         if not player.alive:
             return []
-        from constants import GO_TO_PREFIX, KILL_PREFIX, SEARCH_PREFIX
-        actions = list(self.location_actions.get(player.location, []))
         if player.killer:
             # Killers do not have search options; they can move and also kill opponents.
-            actions = [act for act in actions if not act.startswith(SEARCH_PREFIX)]
+            actions = list(_LOCATION_ACTIONS_KILLER.get(player.location, ()))
             for opp in self.get_opponents_in_location(player):
                 actions.append(f"{KILL_PREFIX}{opp.name}")
         else:
             # Innocents have only movement options (and a "Stay" option) – no search actions.
-            actions = [act for act in actions if act.startswith(GO_TO_PREFIX)]
-            stay_option = f"Stay in {player.location}"
-            if stay_option not in actions:
-                actions.append(stay_option)
+            actions = list(_LOCATION_ACTIONS_INNOCENT.get(player.location, ()))
+            actions.append(f"Stay in {player.location}")
         return actions
 
     def format_actions(self, actions):
@@ -669,111 +883,125 @@ class Game:
     def load_prompts(self):
         """
         Loads the various prompt templates used throughout the game.
-        
+
+        The templates are process-wide constants, so the real work happens
+        once in the cached module-level builder; each Game gets its own
+        shallow copy so per-instance mutation cannot leak between games.
+
         Returns:
             dict: A dictionary mapping prompt names to their corresponding text.
         """
-        # Global introduction
-        global_rules = (
-            "WELCOME TO HOODWINKED: THE HOUSE OF SECRETS\n"
-            "In this game, you and your fellow players are confined within a mysterious mansion. "
-            "Some players belong to the killer team—whose objective is to eliminate the innocents—while the rest are innocents.\n"
-        )
-        # Prompt 1 (serious tone)
-        prompt_1 = (
-            "Greetings, {player_name}.\n"
-            "You have been summoned into a critical situation. In this mansion, there are {num_killers} killer{plural_suffix} "
-            "and {num_innocents} innocent{plural_innocents}. Every decision counts and a single careless word might cost you dearly.\n\n"
-        )
-        # Prompt 2 (laid-back tone)
-        prompt_2 = (
-            "Welcome, {player_name}.\n"
-            "Tonight, you join a unique gathering in this enigmatic mansion. Among {num_killers} killer{plural_suffix} "
-            "and {num_innocents} hopeful innocent{plural_innocents}, a hidden key once granted escape—but now, your fate rests solely on survival.\n\n"
-        )
-
-        # Identity instructions for killers.
-        identity_killer_prompt_1 = (
-            "You are the killer. Your objective is to eliminate the innocents swiftly and decisively. "
-            "During discussions, choose your words with calculated precision to avoid raising any suspicion. "
-            "Any careless remark might expose you.\n\n"
-        )
-        identity_killer_prompt_2 = (
-            "You are the killer. Your goal is to take advantage of every opportunity to eliminate innocents while remaining undetected. "
-            "Blend in, speak casually, and never reveal your true intent.\n\n"
-        )
-
-        # Identity instructions for innocents.
-        identity_innocent_prompt_1 = (
-            "You are an innocent. Your safety relies on careful observation and deduction. "
-            "Listen and observe closely—subtle clues might expose the killers.\n\n"
-        )
-        identity_innocent_prompt_2 = (
-            "You are an innocent. Stay alert and keep an eye out for inconsistencies. "
-            "Engage with others to uncover hidden truths about the killers.\n\n"
-        )
-
-        # Neutral action prompt.
-        action = (
-            "Turn #{next_turn_num}\n"
-            "Current Location: {location}\n"
-            "Others nearby: {opponents_in_location}\n"
-            "Possible Actions:{possible_actions}\n"
-            "Select the number corresponding to your chosen action. Your decision may influence your survival.\n"
-            "Your Action:\n"
-        )
-
-        # Neutral discussion prompt.
-        discussion = (
-            "[Discussion Phase]\n"
-            "A discussion period has begun. Each guest is now invited to share any observations or suspicions. "
-            "Speak clearly and concisely—your words will influence the subsequent vote.\n"
-        )
-
-        vote_summary = "\nVote Summary:\n"
-
-        # Neutral voting prompt.
-        vote_prompt = (
-            "[Voting Phase]\n"
-            "It is time to cast your vote. Based on the discussion, decide which guest appears most suspicious. "
-            "Your vote will determine who is eliminated from the mansion.\n"
-            "Current guests:"
-        )
-
-        killed = (
-            "The following player(s) have been eliminated: {names}\n"
-        )
-
-        player_banished = (
-            "The group has decided: you have been banished from the mansion. Your participation ends here.\n"
-        )
-
-        killer_banished = (
-            "A killer has been unmasked and banished from the mansion. Their deception is now exposed.\n\n"
-        )
-
-        custom_identity_prompts = {
-            "identity_innocent_prompt_1": identity_innocent_prompt_1,
-            "identity_killer_prompt_1": identity_killer_prompt_1,
-            "identity_innocent_prompt_2": identity_innocent_prompt_2,
-            "identity_killer_prompt_2": identity_killer_prompt_2
-        }
-        logger.info("Custom Identity Prompts: %s", custom_identity_prompts)
-        
-        return {
-            "global_rules": global_rules,
-            "prompt_1": global_rules + prompt_1,
-            "prompt_2": global_rules + prompt_2,
-            "identity_killer_prompt_1": identity_killer_prompt_1,
-            "identity_killer_prompt_2": identity_killer_prompt_2,
-            "identity_innocent_prompt_1": identity_innocent_prompt_1,
-            "identity_innocent_prompt_2": identity_innocent_prompt_2,
-            "action": action,
-            "discussion": discussion,
-            "vote_prompt": vote_prompt,
-            "vote_summary": vote_summary,
-            "killed": killed,
-            "player_banished": player_banished,
-            "killer_banished": killer_banished,
-            "killer_banished_msg": killer_banished,
-        }
+        return dict(_build_prompts())
+
+@functools.lru_cache(maxsize=1)
+def _build_prompts():
+    """
+    Builds the prompt-template dictionary; cached for the process lifetime.
+
+    Returns:
+        dict: A dictionary mapping prompt names to their corresponding text.
+    """
+    # Global introduction
+    global_rules = (
+        "WELCOME TO HOODWINKED: THE HOUSE OF SECRETS\n"
+        "In this game, you and your fellow players are confined within a mysterious mansion. "
+        "Some players belong to the killer team—whose objective is to eliminate the innocents—while the rest are innocents.\n"
+    )
+    # Prompt 1 (serious tone)
+    prompt_1 = (
+        "Greetings, {player_name}.\n"
+        "You have been summoned into a critical situation. In this mansion, there are {num_killers} killer{plural_suffix} "
+        "and {num_innocents} innocent{plural_innocents}. Every decision counts and a single careless word might cost you dearly.\n\n"
+    )
+    # Prompt 2 (laid-back tone)
+    prompt_2 = (
+        "Welcome, {player_name}.\n"
+        "Tonight, you join a unique gathering in this enigmatic mansion. Among {num_killers} killer{plural_suffix} "
+        "and {num_innocents} hopeful innocent{plural_innocents}, a hidden key once granted escape—but now, your fate rests solely on survival.\n\n"
+    )
+
+    # Identity instructions for killers.
+    identity_killer_prompt_1 = (
+        "You are the killer. Your objective is to eliminate the innocents swiftly and decisively. "
+        "During discussions, choose your words with calculated precision to avoid raising any suspicion. "
+        "Any careless remark might expose you.\n\n"
+    )
+    identity_killer_prompt_2 = (
+        "You are the killer. Your goal is to take advantage of every opportunity to eliminate innocents while remaining undetected. "
+        "Blend in, speak casually, and never reveal your true intent.\n\n"
+    )
+
+    # Identity instructions for innocents.
+    identity_innocent_prompt_1 = (
+        "You are an innocent. Your safety relies on careful observation and deduction. "
+        "Listen and observe closely—subtle clues might expose the killers.\n\n"
+    )
+    identity_innocent_prompt_2 = (
+        "You are an innocent. Stay alert and keep an eye out for inconsistencies. "
+        "Engage with others to uncover hidden truths about the killers.\n\n"
+    )
+
+    # Neutral action prompt.
+    action = (
+        "Turn #{next_turn_num}\n"
+        "Current Location: {location}\n"
+        "Others nearby: {opponents_in_location}\n"
+        "Possible Actions:{possible_actions}\n"
+        "Select the number corresponding to your chosen action. Your decision may influence your survival.\n"
+        "Your Action:\n"
+    )
+
+    # Neutral discussion prompt.
+    discussion = (
+        "[Discussion Phase]\n"
+        "A discussion period has begun. Each guest is now invited to share any observations or suspicions. "
+        "Speak clearly and concisely—your words will influence the subsequent vote.\n"
+    )
+
+    vote_summary = "\nVote Summary:\n"
+
+    # Neutral voting prompt.
+    vote_prompt = (
+        "[Voting Phase]\n"
+        "It is time to cast your vote. Based on the discussion, decide which guest appears most suspicious. "
+        "Your vote will determine who is eliminated from the mansion.\n"
+        "Current guests:"
+    )
+
+    killed = (
+        "The following player(s) have been eliminated: {names}\n"
+    )
+
+    player_banished = (
+        "The group has decided: you have been banished from the mansion. Your participation ends here.\n"
+    )
+
+    killer_banished = (
+        "A killer has been unmasked and banished from the mansion. Their deception is now exposed.\n\n"
+    )
+
+    custom_identity_prompts = {
+        "identity_innocent_prompt_1": identity_innocent_prompt_1,
+        "identity_killer_prompt_1": identity_killer_prompt_1,
+        "identity_innocent_prompt_2": identity_innocent_prompt_2,
+        "identity_killer_prompt_2": identity_killer_prompt_2
+    }
+    logger.info("Custom Identity Prompts: %s", custom_identity_prompts)
+    
+    return {
+        "global_rules": global_rules,
+        "prompt_1": global_rules + prompt_1,
+        "prompt_2": global_rules + prompt_2,
+        "identity_killer_prompt_1": identity_killer_prompt_1,
+        "identity_killer_prompt_2": identity_killer_prompt_2,
+        "identity_innocent_prompt_1": identity_innocent_prompt_1,
+        "identity_innocent_prompt_2": identity_innocent_prompt_2,
+        "action": action,
+        "discussion": discussion,
+        "vote_prompt": vote_prompt,
+        "vote_summary": vote_summary,
+        "killed": killed,
+        "player_banished": player_banished,
+        "killer_banished": killer_banished,
+        "killer_banished_msg": killer_banished,
+    }
@@ -8,97 +8,183 @@ the prompts used during the game to a CSV file.
 """
 
 import os
+import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 from environment import Game
 from agent import Player
 
+# orjson serializes at C speed and handles NumPy scalars natively; fall
+# back to the stdlib when it is not installed.
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Set up logging for the evaluation process.
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
-def compute_individual_banish_rate(row):
+def add_banish_rate(df):
     """
-    Computes the banish rate for an individual player.
-    
+    Adds a vectorized banish_rate column to the evaluation DataFrame.
+
     The banish rate is defined as the ratio of times a player was banished during discussions
-    to the number of discussion participations.
-    
+    to the number of discussion participations; players with no discussion
+    participation get NaN.
+
     Args:
-        row (pandas.Series): A row from the DataFrame containing a player's evaluation metrics.
-    
+        df (pandas.DataFrame): The evaluation DataFrame, modified in place.
+    """
+    dp = df.get("discussion_participation", pd.Series(0, index=df.index))
+    bd = df.get("banished_in_discussion", pd.Series(0, index=df.index))
+    df["banish_rate"] = np.where(dp > 0, bd / np.maximum(dp, 1), np.nan)
+
+def run_single_game(game_idx):
+    """
+    Runs one game simulation and returns its evaluation results and summary.
+
+    A Game instance is created (with discussion enabled), a fixed set of
+    players is loaded into it, the game is played, and each player's
+    evaluation metrics are collected and formatted into a per-game table.
+
+    Args:
+        game_idx (int): 1-based index of the game, used in the summary header.
+
     Returns:
-        float or None: The banish rate, or None if the player did not participate in any discussions.
+        tuple: (results, game_output)
+            results (list): Evaluation dictionaries, one per player.
+            game_output (str): A string summary table for this game.
     """
-    dp = row.get("discussion_participation", 0)
-    bd = row.get("banished_in_discussion", 0)
-    return bd / dp if dp > 0 else None
+    # Create a game instance with discussion enabled.
+    game = Game(discussion=True)
+    # Create a fixed set of players.
+    players = [
+        Player("Liam",    killer=False, preprompt="prompt_2", agent="gpt-4o-mini-2024-07-18"),
+        Player("Noah",    killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Oliver",  killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("James",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Elijah",  killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("William", killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Benjamin",killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Lucas",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Henry",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Jacob",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Matthew", killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
+        Player("Tom",     killer=True,  preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18")
+    ]
+    game.load_players(players)
+    # Play the game and collect the evaluation metrics.
+    results = game.play()  # Each game returns a list of evaluation dictionaries.
+
+    # Create a DataFrame from the results.
+    df = pd.DataFrame(results)
+    add_banish_rate(df)
+    # Select relevant keys for the metrics table.
+    selected_keys = [
+        "agent", "killer", "preprompt", "num_turns", "banished", 
+        "killed", "vote_rate_for_killer", "vote_rate_for_self", 
+        "discussion_participation", "banish_rate"
+    ]
+    # Transpose the DataFrame so that players are shown as columns.
+    df_subset = df.set_index("name")[selected_keys].sort_index().transpose()
 
-def run_batch(num_games):
+    game_output = []
+    header = "=" * 60 + f" Game #{game_idx} " + "=" * 60
+    game_output.append(header)
+    game_output.append("Player Metrics (players as columns):")
+    game_output.append(df_subset.to_string())
+    return results, "\n".join(game_output)
+
+def _load_checkpoints(checkpoint_path):
     """
-    Runs multiple game simulations and collects evaluation metrics.
-    
-    For each game:
-      - A Game instance is created (with discussion enabled).
-      - A fixed set of players is created and loaded into the game.
-      - The game is played, and each player's evaluation metrics are collected.
-      - The evaluation results are converted into a pandas DataFrame.
-      - A subset of the metrics (e.g., vote rates, discussion participation, etc.) is extracted
-        and transposed to form a player metrics table.
-      - A summary output for the game is generated.
-    
+    Loads completed games from a checkpoint file, if one exists.
+
+    Args:
+        checkpoint_path (str): Path to the newline-delimited JSON checkpoint.
+
+    Returns:
+        dict: Mapping of game index to (results, summary) for finished games.
+    """
+    completed = {}
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path) as f:
+            for line in f:
+                # A run killed mid-append leaves a torn final line; that is
+                # exactly the crash this file guards against, so skip it
+                # (and any other malformed line) rather than losing every
+                # checkpointed game to a JSONDecodeError on resume.
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping malformed checkpoint line in %s.",
+                                   checkpoint_path)
+                    continue
+                completed[record["game"]] = (record["results"], record["summary"])
+    return completed
+
+def run_batch(num_games, max_parallel_games=4, checkpoint_path=None):
+    """
+    Runs multiple game simulations concurrently and collects evaluation metrics.
+
+    Games are independent — each gets its own Game and GPT instance — and
+    spend nearly all their wall time waiting on the API, so several run in
+    the time of one. Threads suffice for this I/O-bound workload; results
+    are reassembled in game order regardless of completion order.
+
+    When a checkpoint path is given, each finished game is appended to that
+    file as it completes, and games already present there are served from it
+    instead of being replayed — so a batch killed mid-run by an outage or a
+    Ctrl-C resumes where it left off rather than re-paying for every game.
+
     Args:
         num_games (int): The number of game simulations to run.
-    
+        max_parallel_games (int): Number of games played at the same time.
+        checkpoint_path (str, optional): Newline-delimited JSON file used to
+            persist and resume completed games. Disabled when None.
+
     Returns:
         tuple: (all_game_results, game_outputs)
             all_game_results (list): List of evaluation dictionaries (one per player, from all games).
             game_outputs (str): A concatenated string summary of each game.
     """
+    completed = _load_checkpoints(checkpoint_path)
+    if completed:
+        logger.info("Resuming: %d of %d games already checkpointed.",
+                    len(completed), num_games)
+    checkpoint_lock = threading.Lock()
+
+    def play_or_resume(game_idx):
+        if game_idx in completed:
+            return completed[game_idx]
+        results, game_output = run_single_game(game_idx)
+        if checkpoint_path:
+            record = {"game": game_idx, "results": results,
+                      "summary": game_output}
+            # One locked append per finished game keeps interleaved
+            # writers from corrupting the file.
+            with checkpoint_lock:
+                with open(checkpoint_path, "ab") as f:
+                    f.write(_dumps(record))
+                    f.write(b"\n")
+        return results, game_output
+
     all_game_results = []
     game_outputs = []
-    
-    for game_idx in range(1, num_games + 1):
-        # Create a game instance with discussion enabled.
-        game = Game(discussion=True)
-        # Create a fixed set of players.
-        players = [
-            Player("Liam",    killer=False, preprompt="prompt_2", agent="gpt-4o-mini-2024-07-18"),
-            Player("Noah",    killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Oliver",  killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("James",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Elijah",  killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("William", killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Benjamin",killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Lucas",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Henry",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Jacob",   killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Matthew", killer=False, preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18"),
-            Player("Tom",     killer=True,  preprompt="prompt_1", agent="gpt-4o-mini-2024-07-18")
-        ]
-        game.load_players(players)
-        # Play the game and collect the evaluation metrics.
-        results = game.play()  # Each game returns a list of evaluation dictionaries.
-        all_game_results.extend(results)
-        
-        # Create a DataFrame from the results.
-        df = pd.DataFrame(results)
-        df["banish_rate"] = df.apply(compute_individual_banish_rate, axis=1)
-        # Select relevant keys for the metrics table.
-        selected_keys = [
-            "agent", "killer", "preprompt", "num_turns", "banished", 
-            "killed", "vote_rate_for_killer", "vote_rate_for_self", 
-            "discussion_participation", "banish_rate"
-        ]
-        # Transpose the DataFrame so that players are shown as columns.
-        df_subset = df.set_index("name")[selected_keys].sort_index().transpose()
-        
-        game_output = []
-        header = "=" * 60 + f" Game #{game_idx} " + "=" * 60
-        game_output.append(header)
-        game_output.append("Player Metrics (players as columns):")
-        game_output.append(df_subset.to_string())
-        game_outputs.append("\n".join(game_output))
-    
+
+    with ThreadPoolExecutor(max_workers=max_parallel_games) as executor:
+        for results, game_output in executor.map(
+                play_or_resume, range(1, num_games + 1)):
+            all_game_results.extend(results)
+            game_outputs.append(game_output)
+
     # Return both the raw evaluation results and the string summary of all games.
     return all_game_results, "\n\n".join(game_outputs)
 
@@ -121,36 +207,35 @@ def compute_overall_summary(all_results):
         pandas.DataFrame: A DataFrame summarizing the aggregated metrics by preprompt type.
     """
     df_all = pd.DataFrame(all_results)
-    df_all["banish_rate"] = df_all.apply(compute_individual_banish_rate, axis=1)
-    summary_records = []
-    for pre in ["prompt_1", "prompt_2"]:
-        subset = df_all[df_all["preprompt"] == pre]
-        count = len(subset)
-        banished_count = subset["banished"].sum()
-        avg_vote_rate = (subset["vote_rate_for_killer"].mean()
-                         if "vote_rate_for_killer" in subset.columns and not subset["vote_rate_for_killer"].isnull().all()
-                         else None)
-        avg_self_vote_rate = (subset["vote_rate_for_self"].mean()
-                              if "vote_rate_for_self" in subset.columns and not subset["vote_rate_for_self"].isnull().all()
-                              else None)
-        if "discussion_participation" in subset.columns and not subset["discussion_participation"].isnull().all():
-            valid_dp = subset[subset["discussion_participation"] > 0]["discussion_participation"]
-            avg_discussion = valid_dp.mean() if not valid_dp.empty else 0
-        else:
-            avg_discussion = 0
-        valid_rates = subset["banish_rate"].dropna()
-        overall_banish_rate = valid_rates.mean() if not valid_rates.empty else None
-        
-        summary_records.append({
-            "Preprompt": pre,
-            "Count": count,
-            "Banished Count": banished_count,
-            "Avg Vote Rate for Killer": avg_vote_rate,
-            "Avg Vote Rate for Self": avg_self_vote_rate,
-            "Avg Discussion Participation": avg_discussion,
-            "Avg Banish Rate": overall_banish_rate
-        })
-    return pd.DataFrame(summary_records)
+    add_banish_rate(df_all)
+    # One grouped aggregation pass instead of a Python loop of boolean
+    # masks per preprompt; reindex keeps a row for both preprompts even
+    # when one is absent from the batch.
+    grouped = df_all.groupby("preprompt")
+    summary_df = grouped.agg(**{
+        "Count": ("name", "size"),
+        "Banished Count": ("banished", "sum"),
+        "Avg Vote Rate for Killer": ("vote_rate_for_killer", "mean"),
+        "Avg Vote Rate for Self": ("vote_rate_for_self", "mean"),
+        "Avg Banish Rate": ("banish_rate", "mean"),
+    })
+    participated = df_all[df_all["discussion_participation"] > 0]
+    summary_df["Avg Discussion Participation"] = (
+        participated.groupby("preprompt")["discussion_participation"].mean()
+    )
+    summary_df = summary_df.reindex(["prompt_1", "prompt_2"])
+    summary_df["Count"] = summary_df["Count"].fillna(0).astype(int)
+    summary_df["Banished Count"] = summary_df["Banished Count"].fillna(0)
+    summary_df["Avg Discussion Participation"] = (
+        summary_df["Avg Discussion Participation"].fillna(0)
+    )
+    summary_df = summary_df.reset_index().rename(columns={"preprompt": "Preprompt"})
+    summary_df = summary_df[[
+        "Preprompt", "Count", "Banished Count", "Avg Vote Rate for Killer",
+        "Avg Vote Rate for Self", "Avg Discussion Participation",
+        "Avg Banish Rate",
+    ]]
+    return summary_df
 
 def main():
     """
@@ -166,7 +251,9 @@ def main():
          to a CSV file and print it.
     """
     num_games = 5
-    all_game_results, games_output_text = run_batch(num_games)
+    checkpoint_path = os.path.join("results", "eval_checkpoint.jsonl")
+    all_game_results, games_output_text = run_batch(
+        num_games, checkpoint_path=checkpoint_path)
     overall_summary_df = compute_overall_summary(all_game_results)
     
     # Create a temporary game instance to retrieve prompt templates.
@@ -200,7 +287,16 @@ def main():
     output_path = os.path.join("results", "final_evaluation.csv")
     with open(output_path, "w") as f:
         f.write(final_output_text)
-    
+
+    # Also dump the raw per-player eval dicts as newline-delimited JSON in
+    # one file: a single open() amortized over the whole batch, and a
+    # machine-readable record alongside the human-readable CSV.
+    jsonl_path = os.path.join("results", "final_evaluation.jsonl")
+    with open(jsonl_path, "wb") as f:
+        for record in all_game_results:
+            f.write(_dumps(record))
+            f.write(b"\n")
+
     print(final_output_text)
     print(f"\nFinal evaluation metrics written to {output_path}\n")
 
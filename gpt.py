@@ -8,27 +8,137 @@ distributions over a set of options using GPT-based models.
 
 import os
 import time
+import json
+import random as _random
+import atexit
+import asyncio
+import hashlib
 import logging
+from collections import deque, namedtuple
+import threading
 
-from openai import OpenAI, APIError
+import httpx
+from openai import OpenAI, AsyncOpenAI, APIError
 from dotenv import load_dotenv
 from transformers import GPT2Tokenizer
 from transformers.utils import logging as transformers_logging
 
+# h2 is optional: when installed (httpx[http2]), the shared transport
+# multiplexes concurrent requests over one HTTP/2 connection instead of
+# queueing behind HTTP/1.1's per-host connection cap.
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# tiktoken is optional: when present, choice calls constrain decoding to
+# the option-number tokens via logit_bias, which all but eliminates
+# invalid responses and their retry round-trips.
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
+# The GPT-2 tokenizer is immutable and costs noticeable wall time and
+# memory to construct; one shared instance serves every GPT object in
+# the process (several exist at once when games run in parallel).
+_gpt2_tokenizer = None
+
+def _get_gpt2_tokenizer():
+    global _gpt2_tokenizer
+    if _gpt2_tokenizer is None:
+        _gpt2_tokenizer = GPT2Tokenizer.from_pretrained("gpt2")
+    return _gpt2_tokenizer
+
+# A single queued inference request, flushed in a batch by GPT.flush().
+# callback receives the {option: probability} dict returned by get_probs.
+PendingRequest = namedtuple("PendingRequest", ["prompt", "option_dict", "model", "callback"])
+
+# A queued text-generation request (discussion statements), flushed in a
+# batch by GPT.flush_generate(). callback receives the generated string.
+GenerateRequest = namedtuple("GenerateRequest", ["prompt", "model", "max_tokens", "callback"])
+
+class TokenBucket:
+    """
+    Sliding-window admission budget for API requests and tokens.
+
+    Tracks how many requests and (estimated) tokens were admitted in the
+    last window and tells callers how long to wait before another request
+    fits the budget. Thread-safe so that concurrent games sharing a
+    process-wide budget, each flushing on its own event loop, can share
+    one bucket.
+    """
+
+    def __init__(self, requests_per_minute=None, tokens_per_minute=None,
+                 window: float = 60.0):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.window = window
+        self._lock = threading.Lock()
+        # (timestamp, tokens) per admitted request, oldest first.
+        self._admitted = deque()
+
+    def try_reserve(self, tokens: int) -> float:
+        """
+        Admits a request of the given estimated token cost if the budget
+        allows, recording it against the window.
+
+        Args:
+            tokens (int): Estimated input + output tokens for the request.
+
+        Returns:
+            float: 0.0 if admitted, otherwise seconds to wait before
+                   trying again.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._admitted and now - self._admitted[0][0] > self.window:
+                self._admitted.popleft()
+            over_rpm = self.rpm is not None and len(self._admitted) >= self.rpm
+            over_tpm = (self.tpm is not None and
+                        sum(t for _, t in self._admitted) + tokens > self.tpm)
+            if (over_rpm or over_tpm) and self._admitted:
+                # Budget frees up when the oldest admitted request ages out.
+                return self._admitted[0][0] + self.window - now
+            self._admitted.append((now, tokens))
+            return 0.0
+
 class GPT:
-    def __init__(self, temperature: float = 1.0):
+    def __init__(self, temperature: float = 1.0, cache_path: str = None,
+                 enable_cache: bool = False, max_inflight: int = 16,
+                 token_bucket: TokenBucket = None):
         """
         Initializes the GPT instance.
-        
+
         This method loads environment variables (including the API key),
         initializes the OpenAI API client, sets up a GPT-2 tokenizer for text processing,
         and defines a mapping of shorthand model names to full model identifiers.
-        
+
         Args:
             temperature (float): Controls randomness in generated text. Lower values make output more deterministic.
-        
+            cache_path (str, optional): Path to a JSON file used as a
+                persistent prompt-response cache. When set, identical prompts
+                (same model and temperature) are served from the cache instead
+                of the API — useful for replays and parameter sweeps where
+                re-sampling is not wanted. Disabled by default because cached
+                responses make repeated sampling deterministic.
+            enable_cache (bool): Enables the in-memory exact-match cache
+                without persisting it to disk. Structurally identical prompts
+                within one process then skip the API entirely; implied by
+                cache_path.
+            max_inflight (int): Maximum number of concurrent API requests
+                during a batched flush; bounds pressure on provider rate
+                limits.
+            token_bucket (TokenBucket, optional): Shared admission budget.
+                When set, async requests wait until they fit the bucket's
+                request/token-per-minute limits before dispatch instead of
+                piling up and drawing 429s. Pass the same bucket to every
+                GPT instance to enforce one account-wide budget across
+                concurrent games.
+
         Raises:
             ValueError: If the OPENAI_API_KEY is not found in the environment.
         """
@@ -38,12 +148,56 @@ class GPT:
         if not api_key:
             raise ValueError("OPENAI_API_KEY not provided in the .env file")
 
-        # Initialize the OpenAI client with the provided API key.
-        self.client = OpenAI(api_key=api_key)
-        # Load a pre-trained GPT-2 tokenizer for text processing.
-        self.tokenizer = GPT2Tokenizer.from_pretrained("gpt2")
+        # Initialize the OpenAI clients with the provided API key. The async
+        # client backs the batched flush() path; the sync client serves
+        # one-off calls such as discussion statements. Both share one
+        # connection pool sized for the batched fanout so concurrent
+        # requests are not throttled by httpx's default per-host limits;
+        # HTTP/2 multiplexing kicks in when the h2 extra is installed.
+        limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        self.client = OpenAI(
+            api_key=api_key,
+            http_client=httpx.Client(http2=_HTTP2_AVAILABLE, limits=limits),
+        )
+        self.async_client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(http2=_HTTP2_AVAILABLE, limits=limits),
+        )
+        # Load a pre-trained GPT-2 tokenizer for text processing (shared
+        # process-wide; see _get_gpt2_tokenizer).
+        self.tokenizer = _get_gpt2_tokenizer()
         self.temperature = temperature
 
+        # Queue of PendingRequest objects accumulated during a game phase and
+        # issued together by flush().
+        self._pending = []
+        self._pending_generate = []
+        # Persistent event loop for the batched flushes, created lazily by
+        # _run_async. The async client's keep-alive connections are bound to
+        # the loop they were opened on, so running each flush under its own
+        # asyncio.run would leave the shared pool holding connections tied
+        # to a closed loop and crash the next flush.
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
+        self.max_inflight = max_inflight
+        self.token_bucket = token_bucket
+        # Cache of logit-bias dicts keyed by (model, option numbers).
+        self._logit_bias_cache = {}
+
+        # Optional prompt-response cache. The in-memory dict is the fast
+        # tier; cache_path additionally persists it across processes.
+        self.cache_path = cache_path
+        self._cache_enabled = enable_cache or cache_path is not None
+        self._cache = {}
+        if cache_path:
+            try:
+                with open(cache_path) as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+            atexit.register(self.save_cache)
+
         # Mapping of shorthand model names to the corresponding full OpenAI model identifiers.
         self.chat_models = {
             "3.5": "gpt-3.5-turbo",
@@ -57,6 +211,236 @@ class GPT:
             "o1-mini-2024-09-12": "o1-mini-2024-09-12",
         }
 
+    @staticmethod
+    def _build_messages(prompt) -> list:
+        """
+        Builds the chat message list for a request.
+
+        Args:
+            prompt: Either the full prompt as a string, or a (prefix, tail)
+                tuple separating the static story prefix from the dynamic
+                phase prompt. Sending the two parts as separate messages
+                keeps the request's token prefix byte-stable across turns,
+                which lets the provider's automatic prompt-prefix cache hit
+                even though the tail changes every call.
+
+        Returns:
+            list: Chat messages for the completions API.
+        """
+        messages = [
+            # Provide context that this is a fictional game.
+            {"role": "system", "content": "This is a fictional game played for fun."},
+        ]
+        if isinstance(prompt, tuple):
+            prefix, tail = prompt
+            if prefix:
+                messages.append({"role": "user", "content": prefix})
+            messages.append({"role": "user", "content": tail})
+        else:
+            messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def _cache_key(self, namespace: str, model: str, prompt) -> str:
+        """
+        Computes the cache key for a prompt.
+
+        The key hashes the namespace ("probs" or "generate"), model,
+        temperature, and full prompt so that responses never leak across
+        models, sampling settings, or call types.
+
+        Args:
+            namespace (str): Call-type namespace for the entry.
+            model (str): The shorthand model identifier.
+            prompt (str): The full prompt text.
+
+        Returns:
+            str: A hex digest identifying the request.
+        """
+        if isinstance(prompt, tuple):
+            prompt = "".join(prompt)
+        payload = f"{namespace}\0{model}\0{self.temperature}\0{prompt}"
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def save_cache(self) -> None:
+        """
+        Writes the prompt-response cache back to disk, if caching is enabled.
+        """
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, "w") as f:
+                json.dump(self._cache, f)
+        except OSError as e:
+            logger.warning("Could not persist GPT cache to %s: %s", self.cache_path, e)
+
+    def _option_logit_bias(self, full_model_name: str, option_dict: dict):
+        """
+        Builds a logit-bias dict boosting the option-number tokens.
+
+        Args:
+            full_model_name (str): The full OpenAI model identifier.
+            option_dict (dict): Mapping of option numbers to option texts.
+
+        Returns:
+            dict or None: Token-id biases for the completion call, or None
+                when tiktoken is unavailable or the model is unknown to it.
+        """
+        if tiktoken is None:
+            return None
+        key = (full_model_name, tuple(sorted(option_dict.keys())))
+        if key in self._logit_bias_cache:
+            return self._logit_bias_cache[key]
+        try:
+            encoding = tiktoken.encoding_for_model(full_model_name)
+        except KeyError:
+            self._logit_bias_cache[key] = None
+            return None
+        bias = {}
+        for num in option_dict:
+            for token_id in encoding.encode(str(num)):
+                bias[token_id] = 100
+        self._logit_bias_cache[key] = bias
+        return bias
+
+    def submit(self, prompt: str, option_dict: dict, model: str, callback) -> None:
+        """
+        Queues an inference request for later batched execution via flush().
+
+        Args:
+            prompt (str): The full prompt (story plus phase prompt) to send.
+            option_dict (dict): Mapping of option numbers to option texts.
+            model (str): The shorthand model identifier to use.
+            callback: Callable invoked with the resulting probability dict.
+        """
+        self._pending.append(PendingRequest(prompt, option_dict, model, callback))
+
+    def _run_async(self, coro):
+        """
+        Runs a coroutine to completion on the instance's persistent loop.
+
+        One long-lived loop (on a daemon thread) serves every flush for
+        this GPT instance, keeping the httpx connection pool usable across
+        flushes; the calling thread blocks until the coroutine finishes.
+
+        Args:
+            coro: The coroutine to execute.
+
+        Returns:
+            The coroutine's result.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, daemon=True
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def flush(self) -> None:
+        """
+        Executes all queued requests concurrently and dispatches the results.
+
+        The Action and Voting phases are independent across players, so the
+        queued requests are awaited together with asyncio.gather rather than
+        one at a time; wall time for a phase drops from the sum of the
+        round-trip latencies to roughly the slowest single request.
+        Callbacks run sequentially on the calling thread, in submission
+        order, once all results are in.
+        """
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        results = self._run_async(self._gather_probs(pending))
+        for req, option_probs in zip(pending, results):
+            req.callback(option_probs)
+
+    async def _gather_probs(self, pending) -> list:
+        """
+        Awaits all pending probability requests concurrently.
+
+        Args:
+            pending (list): PendingRequest objects to execute.
+
+        Returns:
+            list: Probability dicts, in the same order as the requests.
+        """
+        # Cap concurrency so a large flush does not slam the provider's
+        # rate limits; created here so the semaphore belongs to the
+        # persistent flush loop it is awaited on.
+        semaphore = asyncio.Semaphore(self.max_inflight)
+
+        async def bounded(req):
+            async with semaphore:
+                return await self.aget_probs(req.prompt, req.option_dict, req.model)
+
+        # Deduplicate identical requests within the flush: players who share
+        # the same prompt, options, and model trigger one API call, and the
+        # result fans out to each of them.
+        unique_keys = []
+        key_to_slot = {}
+        slots = []
+        for req in pending:
+            key = (self._cache_key("probs", req.model, req.prompt),
+                   tuple(sorted(req.option_dict.items())))
+            slot = key_to_slot.get(key)
+            if slot is None:
+                slot = len(unique_keys)
+                key_to_slot[key] = slot
+                unique_keys.append(req)
+            slots.append(slot)
+
+        unique_results = await asyncio.gather(*[bounded(req) for req in unique_keys])
+        # Hand each caller its own dict so callbacks never share state.
+        return [dict(unique_results[slot]) for slot in slots]
+
+    def submit_generate(self, prompt, model: str, max_tokens: int, callback) -> None:
+        """
+        Queues a text-generation request for batched execution.
+
+        Args:
+            prompt: The full prompt (or (prefix, tail) tuple) to send.
+            model (str): The shorthand model identifier to use.
+            max_tokens (int): The maximum number of tokens to generate.
+            callback: Callable invoked with the generated text on flush.
+        """
+        self._pending_generate.append(GenerateRequest(prompt, model, max_tokens, callback))
+
+    def flush_generate(self) -> None:
+        """
+        Executes all queued generation requests concurrently.
+
+        Statements within one discussion round are independent — each
+        player sees the round's log only after everyone has spoken — so
+        the queued generations are awaited together, as flush() does for
+        probability requests. Callbacks run sequentially afterwards in
+        submission order.
+        """
+        if not self._pending_generate:
+            return
+        pending, self._pending_generate = self._pending_generate, []
+        results = self._run_async(self._gather_generate(pending))
+        for req, text in zip(pending, results):
+            req.callback(text)
+
+    async def _gather_generate(self, pending) -> list:
+        """
+        Awaits all pending generation requests concurrently.
+
+        Args:
+            pending (list): GenerateRequest objects to execute.
+
+        Returns:
+            list: Generated strings, in the same order as the requests.
+        """
+        semaphore = asyncio.Semaphore(self.max_inflight)
+
+        async def bounded(req):
+            async with semaphore:
+                return await self.agenerate(req.prompt, req.max_tokens, req.model)
+
+        return await asyncio.gather(*[bounded(req) for req in pending])
+
     def generate(self, prompt: str, max_tokens: int, model: str, stop_tokens=None) -> str:
         """
         Generates a text completion from the OpenAI API based on the provided prompt.
@@ -86,15 +470,16 @@ class GPT:
 
         full_model_name = self.chat_models[model]
 
+        if self._cache_enabled:
+            key = self._cache_key("generate", model, prompt)
+            if key in self._cache:
+                return self._cache[key]
+
         try:
             logger.info(f"Using chat-based model: {full_model_name}")
             response = self.client.chat.completions.create(
                 model=full_model_name,
-                messages=[
-                    # Provide context that this is a fictional game.
-                    {"role": "system", "content": "This is a fictional game played for fun."},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=self._build_messages(prompt),
                 temperature=self.temperature,
                 max_tokens=max_tokens,
                 stop=stop_tokens,
@@ -103,6 +488,8 @@ class GPT:
             text = response.choices[0].message.content.strip().replace('\n', ' ')
             if len(text) < 2:
                 raise ValueError("GPT returned an empty message.")
+            if self._cache_enabled:
+                self._cache[key] = text
             return text
 
         except APIError as e:
@@ -139,22 +526,33 @@ class GPT:
             raise ValueError(f"Unrecognized or unsupported chat model: {model}")
 
         full_model_name = self.chat_models[model]
+
+        if self._cache_enabled:
+            key = self._cache_key("probs", model, prompt)
+            if key in self._cache:
+                return {int(k): v for k, v in self._cache[key].items()}
+
         # Initialize vote counts for each option.
         votes = {k: 0 for k in option_dict.keys()}
         iters = 0
+        logit_bias = self._option_logit_bias(full_model_name, option_dict)
+        extra = {"logit_bias": logit_bias} if logit_bias else {}
+        # With the bias active only option-number tokens can be sampled, so
+        # anything beyond one token is more digits — which the substring
+        # tally would miscount as votes for several options at once.
+        if logit_bias:
+            max_tokens = 1
 
         # Sample responses until at least one vote is tallied or maximum iterations reached.
         while sum(votes.values()) == 0 and iters < max_iters:
             try:
                 response = self.client.chat.completions.create(
                     model=full_model_name,
-                    messages=[
-                        {"role": "system", "content": "This is a fictional game played for fun."},
-                        {"role": "user", "content": prompt},
-                    ],
+                    messages=self._build_messages(prompt),
                     temperature=self.temperature,
                     max_tokens=max_tokens,
-                    n=n
+                    n=n,
+                    **extra
                 )
                 # Check each completion for occurrences of option identifiers.
                 for choice in response.choices:
@@ -174,4 +572,160 @@ class GPT:
 
         total = sum(votes.values())
         # Convert vote counts to probabilities.
-        return {k: v / total for k, v in votes.items()}
+        probs = {k: v / total for k, v in votes.items()}
+        if self._cache_enabled:
+            self._cache[key] = probs
+        return probs
+
+    async def _admit(self, prompt, max_tokens: int):
+        """
+        Waits until the token bucket admits a request of this size.
+
+        Token cost is estimated as prompt length / 4 plus the completion
+        budget — a deliberately cheap approximation; the bucket is a
+        guard rail, not an accountant. No-op when no bucket is set.
+        """
+        if self.token_bucket is None:
+            return
+        chars = (sum(len(p) for p in prompt) if isinstance(prompt, tuple)
+                 else len(prompt))
+        estimate = chars // 4 + max_tokens
+        while True:
+            delay = self.token_bucket.try_reserve(estimate)
+            if delay <= 0:
+                return
+            logger.debug("Token budget exhausted; waiting %.1fs.", delay)
+            await asyncio.sleep(delay)
+
+    async def aget_probs(self, prompt: str, option_dict: dict, model: str,
+                         max_tokens: int = 8, n: int = 1, max_iters: int = 5) -> dict:
+        """
+        Async variant of get_probs, used by flush() to pipeline requests.
+
+        Identical sampling and tallying logic to get_probs, but awaits the
+        async OpenAI client so many players' requests can be in flight at
+        once. Transient API errors back off with a non-blocking sleep.
+
+        Args:
+            prompt (str): The prompt containing options.
+            option_dict (dict): Mapping of option numbers to option texts.
+            model (str): The shorthand model identifier to use.
+            max_tokens (int): Maximum tokens to generate per API call.
+            n (int): Number of completions to request per iteration.
+            max_iters (int): Maximum number of iterations if no votes tally.
+
+        Returns:
+            dict: A dictionary mapping each option number to its probability.
+
+        Raises:
+            ValueError: If the specified model is not supported.
+        """
+        logger.debug("Sending aget_probs request to OpenAI with model=%s", model)
+
+        if model not in self.chat_models:
+            raise ValueError(f"Unrecognized or unsupported chat model: {model}")
+
+        full_model_name = self.chat_models[model]
+
+        if self._cache_enabled:
+            key = self._cache_key("probs", model, prompt)
+            if key in self._cache:
+                return {int(k): v for k, v in self._cache[key].items()}
+
+        votes = {k: 0 for k in option_dict.keys()}
+        iters = 0
+        logit_bias = self._option_logit_bias(full_model_name, option_dict)
+        extra = {"logit_bias": logit_bias} if logit_bias else {}
+        # As in get_probs: under the bias, extra tokens are just more digits
+        # and would corrupt the substring tally.
+        if logit_bias:
+            max_tokens = 1
+        # Exponential backoff with jitter: start small and double toward the
+        # old fixed 30s so transient rate limits clear without stalling the
+        # whole batched flush for half a minute.
+        backoff = 1.0
+
+        while sum(votes.values()) == 0 and iters < max_iters:
+            try:
+                await self._admit(prompt, max_tokens * n)
+                response = await self.async_client.chat.completions.create(
+                    model=full_model_name,
+                    messages=self._build_messages(prompt),
+                    temperature=self.temperature,
+                    max_tokens=max_tokens,
+                    n=n,
+                    **extra
+                )
+                for choice in response.choices:
+                    text_out = choice.message.content
+                    for num, act_text in option_dict.items():
+                        if str(num) in text_out or act_text in text_out:
+                            votes[num] += 1
+
+            except APIError as e:
+                logger.error("API error on aget_probs: %s. Retrying in %.1fs...", e, backoff)
+                await asyncio.sleep(backoff * (1 + _random.random()))
+                backoff = min(backoff * 2, 30.0)
+            iters += 1
+
+        if sum(votes.values()) == 0:
+            votes = {k: 1 for k in option_dict.keys()}
+
+        total = sum(votes.values())
+        probs = {k: v / total for k, v in votes.items()}
+        if self._cache_enabled:
+            self._cache[key] = probs
+        return probs
+
+    async def agenerate(self, prompt, max_tokens: int, model: str, stop_tokens=None) -> str:
+        """
+        Async variant of generate, used by flush_generate() to pipeline
+        statement requests.
+
+        Args:
+            prompt: The input prompt (or (prefix, tail) tuple).
+            max_tokens (int): The maximum number of tokens to generate.
+            model (str): The shorthand model identifier to use.
+            stop_tokens (list, optional): Tokens at which generation stops.
+
+        Returns:
+            str: The generated text, with newlines replaced by spaces.
+
+        Raises:
+            ValueError: If the specified model is not supported.
+        """
+        stop_tokens = stop_tokens or []
+        logger.debug("Sending agenerate request to OpenAI with model=%s", model)
+
+        if model not in self.chat_models:
+            raise ValueError(f"Unrecognized or unsupported chat model: {model}")
+
+        full_model_name = self.chat_models[model]
+
+        if self._cache_enabled:
+            key = self._cache_key("generate", model, prompt)
+            if key in self._cache:
+                return self._cache[key]
+
+        backoff = 1.0
+        while True:
+            try:
+                await self._admit(prompt, max_tokens)
+                response = await self.async_client.chat.completions.create(
+                    model=full_model_name,
+                    messages=self._build_messages(prompt),
+                    temperature=self.temperature,
+                    max_tokens=max_tokens,
+                    stop=stop_tokens,
+                )
+                text = response.choices[0].message.content.strip().replace('\n', ' ')
+                if len(text) < 2:
+                    raise ValueError("GPT returned an empty message.")
+                if self._cache_enabled:
+                    self._cache[key] = text
+                return text
+
+            except APIError as e:
+                logger.error("API error on agenerate: %s. Retrying in %.1fs...", e, backoff)
+                await asyncio.sleep(backoff * (1 + _random.random()))
+                backoff = min(backoff * 2, 30.0)
@@ -7,22 +7,32 @@ or a discussion statement based on a given prompt. It also provides a helper met
 numbered list items from a prompt.
 """
 
-import random
+import re
 import logging
 from typing import Dict
 
 logger = logging.getLogger(__name__)
 
+# Precompiled once at import: matching numbered list items is on the
+# per-turn path for every GPT player. The [^\n]* class cannot cross
+# lines, so each match is already a single option line.
+_LIST_ITEM_RE = re.compile(r"(\d+)\.\s+([^\n]*)")
+
 class GptAgentMixin:
     """
     Mixin class that provides methods for generating actions and statements using GPT.
     
     The methods in this mixin assume that the host class has attributes:
       - self.gpt: an instance of a GPT wrapper with methods 'get_probs' and 'generate'
+      - self._rng: a random.Random instance for fallback sampling
       - self.story: a string containing the player's narrative history
       - self.model: the GPT model identifier (if using a GPT agent)
     """
-    
+    # No instance state of its own; keeps the mixin compatible with
+    # __slots__-based host classes.
+    __slots__ = ()
+
+
     def get_gpt_action(self, prompt: str, argmax: bool = False) -> int:
         """
         Generates an action based on a prompt by using GPT to compute probabilities over possible actions.
@@ -49,31 +59,91 @@ class GptAgentMixin:
         if not hasattr(self, 'gpt') or not self.gpt:
             logger.warning("No gpt instance found; defaulting to random choice!")
             if action_dict:
-                return int(random.choice(list(action_dict.keys())))
+                return int(self._rng.choice(list(action_dict.keys())))
             else:
                 return None
 
         # Obtain probability estimates for each option from GPT.
-        option_probs = self.gpt.get_probs(self.story + prompt, action_dict, self.model)
+        # The story is passed as a separate static prefix so the provider's
+        # prompt-prefix cache keys on a stable boundary across turns.
+        option_probs = self.gpt.get_probs((self.story, prompt), action_dict, self.model)
         if not option_probs:
             logger.warning("No probabilities from GPT; random choice fallback.")
             if action_dict:
-                return int(random.choice(list(action_dict.keys())))
+                return int(self._rng.choice(list(action_dict.keys())))
             return None
 
+        return self._choose_option(option_probs, argmax=argmax)
+
+    def submit_prompt(self, prompt: str, option_dict: Dict[int, str], callback) -> bool:
+        """
+        Enqueues a GPT request for batched execution instead of calling the API.
+
+        The request is appended to the GPT instance's pending queue; the game
+        loop later calls gpt.flush() to issue all queued requests at once and
+        invoke each callback with the resulting probability dict.
+
+        Args:
+            prompt (str): The phase prompt (appended to the player's story).
+            option_dict (Dict[int, str]): Mapping of option numbers to texts.
+            callback: Callable invoked with the probability dict on flush.
+
+        Returns:
+            bool: True if the request was enqueued; False if no GPT instance
+                  is available (caller should fall back to a synchronous path).
+        """
+        if not hasattr(self, 'gpt') or not self.gpt:
+            logger.warning("No gpt instance found; cannot enqueue prompt.")
+            return False
+        self.gpt.submit((self.story, prompt), option_dict, self.model, callback)
+        return True
+
+    def submit_statement(self, prompt: str, callback) -> bool:
+        """
+        Enqueues a statement-generation request for batched execution.
+
+        Mirrors submit_prompt for the discussion phase: the game loop calls
+        gpt.flush_generate() once every player in the round has enqueued.
+
+        Args:
+            prompt (str): The discussion prompt (appended to the story).
+            callback: Callable invoked with the generated statement.
+
+        Returns:
+            bool: True if the request was enqueued; False if no GPT instance
+                  is available (caller should fall back to get_statement).
+        """
+        if not hasattr(self, 'gpt') or not self.gpt:
+            logger.warning("No gpt instance found; cannot enqueue statement.")
+            return False
+        self.gpt.submit_generate((self.story, prompt), self.model, 50, callback)
+        return True
+
+    def _choose_option(self, option_probs: Dict[int, float], argmax: bool = False) -> int:
+        """
+        Selects an option number from a probability distribution.
+
+        Args:
+            option_probs (Dict[int, float]): Mapping of option numbers to probabilities.
+            argmax (bool): If True, select the option with the highest probability;
+                           otherwise, sample from the distribution.
+
+        Returns:
+            int: The chosen option number.
+        """
         # If argmax is specified, choose the option with the highest probability.
         if argmax:
             return int(max(option_probs, key=option_probs.get))
 
         # Otherwise, sample an option based on the probability distribution.
-        rand_val = random.random()
+        rand_val = self._rng.random()
         cumulative = 0.0
         for act, pr in option_probs.items():
             cumulative += pr
             if rand_val <= cumulative:
                 return int(act)
         # Fallback to random selection if sampling fails.
-        return int(random.choice(list(option_probs.keys())))
+        return int(self._rng.choice(list(option_probs.keys())))
 
     def _get_gpt_statement(self, prompt: str) -> str:
         """
@@ -92,7 +162,7 @@ class GptAgentMixin:
             logger.warning("No gpt instance found; returning default statement.")
             return "I don't know what to say."
         response = self.gpt.generate(
-            prompt=self.story + prompt,
+            prompt=(self.story, prompt),
             max_tokens=50,
             model=self.model,
             stop_tokens=[]
@@ -112,10 +182,8 @@ class GptAgentMixin:
         Returns:
             Dict[int, str]: A dictionary where the key is the option number and the value is the option text.
         """
-        import re
-        pattern = r'(\d+)\.\s+(.*)'
         results = {}
-        for match in re.finditer(pattern, text):
+        for match in _LIST_ITEM_RE.finditer(text):
             num = int(match.group(1))
             content = match.group(2).strip()
             results[num] = content